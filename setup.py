@@ -16,6 +16,9 @@ setup(
         "Pillow>=9.0.0",
         "tksvg>=0.7.0",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "tarkov-assistant=tarkov_app.main:main",
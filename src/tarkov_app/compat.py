@@ -0,0 +1,7 @@
+"""
+Compatibility helpers for the Python versions the Tarkov Map Assistant supports.
+"""
+import sys
+
+# Store dataclass fields in slots where supported (Python 3.10+)
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -7,10 +7,25 @@ and other application settings.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
+import types
+from typing import Dict, Any, Optional, Mapping
+
+from .json_loader import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Fallback map configuration, shared read-only so lookup misses don't allocate
+DEFAULT_MAP_CONFIG = types.MappingProxyType({
+    "centerMinX": -300,
+    "centerMaxX": 300,
+    "centerMinY": -300,
+    "centerMaxY": 300,
+    "pointMinX": -300,
+    "pointMaxX": 300,
+    "pointMinY": -300,
+    "pointMaxY": 300
+})
+
 class ConfigManager:
     """Manages application configuration and map coordinate settings."""
     
@@ -28,8 +43,8 @@ class ConfigManager:
     def load_config(self) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(self.config_path, 'r') as file:
-                self.config_data = json.load(file)
+            with open(self.config_path, 'rb') as file:
+                self.config_data = _json_loads(file.read())
                 logger.info(f"Configuration loaded from {self.config_path}")
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {self.config_path}")
@@ -66,20 +81,11 @@ class ConfigManager:
         return [name for name in self.config_data.keys() if name != "Default"]
     
     @staticmethod
-    def _get_default_map_config() -> Dict[str, float]:
+    def _get_default_map_config() -> Mapping[str, float]:
         """
         Get default map configuration.
         
         Returns:
-            Dictionary with default map configuration values
+            Read-only mapping with default map configuration values
         """
-        return {
-            "centerMinX": -300,
-            "centerMaxX": 300,
-            "centerMinY": -300,
-            "centerMaxY": 300,
-            "pointMinX": -300,
-            "pointMaxX": 300,
-            "pointMinY": -300,
-            "pointMaxY": 300
-        }
\ No newline at end of file
+        return DEFAULT_MAP_CONFIG
\ No newline at end of file
@@ -7,8 +7,11 @@ with both the custom map configuration and the official tarkovdata maps.
 import os
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Mapping
 
+from ..config_manager import DEFAULT_MAP_CONFIG
+from ..json_loader import loads as _json_loads
 from .tarkov_data import TarkovDataManager
 
 logger = logging.getLogger(__name__)
@@ -37,14 +40,38 @@ class MapDataManager:
         self.maps_dir = maps_dir
         self.custom_config = {}
         self.additional_config = {}
+        
+        # Cached listing of the maps directory, refreshed when its mtime changes
+        self._dir_mtime = None
+        self._svg_files = None
+        self._svg_lower_map = {}
+        self._svg_index = []
+        self._available_maps_cache = None
+        self._available_maps_mtime = None
+        
+        # Lowercased lookup indexes, built once since the underlying data never changes
+        self._custom_lower = {}
+        self._maps_by_key = None
+        self._maps_by_locale = None
+        self._official_configs = None
+        
         self.load_custom_config()
+        
+        # Parse tarkovdata maps while the GUI is being built
+        if self.tarkov_data and self.tarkov_data.is_available():
+            threading.Thread(
+                target=self.tarkov_data.preload,
+                args=(("maps",),),
+                daemon=True,
+                name="preload-maps"
+            ).start()
     
     def load_custom_config(self) -> None:
         """Load custom map configuration from JSON files."""
         # Load primary config
         try:
-            with open(self.custom_config_path, 'r') as file:
-                self.custom_config = json.load(file)
+            with open(self.custom_config_path, 'rb') as file:
+                self.custom_config = _json_loads(file.read())
                 logger.info(f"Custom map configuration loaded from {self.custom_config_path}")
         except FileNotFoundError:
             logger.error(f"Custom map configuration file not found: {self.custom_config_path}")
@@ -56,8 +83,8 @@ class MapDataManager:
         # Load additional config if available
         if self.additional_config_path:
             try:
-                with open(self.additional_config_path, 'r') as file:
-                    self.additional_config = json.load(file)
+                with open(self.additional_config_path, 'rb') as file:
+                    self.additional_config = _json_loads(file.read())
                     logger.info(f"Additional map configuration loaded from {self.additional_config_path}")
                     # Merge additional config with primary config
                     self.custom_config.update(self.additional_config)
@@ -65,6 +92,31 @@ class MapDataManager:
                 logger.warning(f"Additional map configuration file not found: {self.additional_config_path}")
             except json.JSONDecodeError:
                 logger.warning(f"Invalid JSON in additional map configuration file: {self.additional_config_path}")
+        
+        self._custom_lower = {name.lower(): config for name, config in self.custom_config.items()}
+        self._available_maps_cache = None
+    
+    def _refresh_dir_cache(self) -> None:
+        """Refresh the cached SVG listing if the maps directory has changed."""
+        try:
+            dir_mtime = os.stat(self.maps_dir).st_mtime
+        except OSError:
+            self._dir_mtime = None
+            self._svg_files = []
+            self._svg_lower_map = {}
+            self._svg_index = []
+            return
+        
+        if self._svg_files is not None and dir_mtime == self._dir_mtime:
+            return
+        
+        with os.scandir(self.maps_dir) as entries:
+            svg_entries = [entry for entry in entries if entry.name.endswith(".svg") and entry.is_file()]
+        self._svg_files = [entry.name for entry in svg_entries]
+        # (lowercased base name, path) pairs for the fuzzy filename search
+        self._svg_index = [(entry.name[:-4].lower(), entry.path) for entry in svg_entries]
+        self._svg_lower_map = dict(self._svg_index)
+        self._dir_mtime = dir_mtime
     
     def get_available_maps(self) -> List[str]:
         """
@@ -73,6 +125,10 @@ class MapDataManager:
         Returns:
             List of map names
         """
+        self._refresh_dir_cache()
+        if self._available_maps_cache is not None and self._available_maps_mtime == self._dir_mtime:
+            return list(self._available_maps_cache)
+        
         available_maps = set()
         
         # Add maps from custom config
@@ -89,13 +145,11 @@ class MapDataManager:
                 logger.warning(f"Could not retrieve maps from tarkovdata: {e}")
             
         # Check which maps have SVG files (this is the most important source)
-        if os.path.exists(self.maps_dir):
-            for file in os.listdir(self.maps_dir):
-                if file.endswith(".svg"):
-                    map_name = os.path.splitext(file)[0]
-                    available_maps.add(map_name)
+        available_maps.update(file[:-4] for file in self._svg_files)
         
-        return sorted(list(available_maps))
+        self._available_maps_cache = tuple(sorted(available_maps))
+        self._available_maps_mtime = self._dir_mtime
+        return list(self._available_maps_cache)
     
     def get_map_config(self, map_name: str) -> Dict[str, float]:
         """
@@ -108,34 +162,15 @@ class MapDataManager:
             Dictionary containing map configuration values
         """
         # First check custom config (highest priority)
-        if map_name in self.custom_config:
-            return self.custom_config[map_name]
+        custom = self._custom_lower.get(map_name.lower())
+        if custom is not None:
+            return custom
         
-        # Try to get info from tarkovdata if available
-        if self.tarkov_data and self.tarkov_data.is_available():
-            official_map_info = self._get_official_map_info(map_name)
-            if official_map_info:
-                # Convert official bounds to our format
-                try:
-                    bounds = official_map_info["svg"]["bounds"]
-                    rotation = official_map_info["svg"]["coordinateRotation"]
-                    
-                    # Adjust for rotation
-                    if rotation == 180:
-                        return {
-                            "centerMinX": bounds[1][0],
-                            "centerMaxX": bounds[0][0],
-                            "centerMinY": bounds[0][1],
-                            "centerMaxY": bounds[1][1],
-                            "pointMinX": bounds[1][0],
-                            "pointMaxX": bounds[0][0],
-                            "pointMinY": bounds[0][1],
-                            "pointMaxY": bounds[1][1]
-                        }
-                    else:
-                        logger.warning(f"Unsupported coordinate rotation for {map_name}: {rotation}")
-                except (KeyError, IndexError):
-                    logger.warning(f"Could not extract bounds from official map info for {map_name}")
+        # Then configs converted from tarkovdata bounds
+        if self._official_index_ready():
+            official_config = self._official_configs.get(map_name.lower())
+            if official_config is not None:
+                return official_config
         
         logger.warning(f"No configuration found for map: {map_name}, using default")
         return self.custom_config.get("Default", self._get_default_map_config())
@@ -163,46 +198,38 @@ class MapDataManager:
         # Apply mapping if available
         search_name = map_name_mapping.get(map_name, map_name)
         
-        # Try direct match (most common case)
-        map_file = f"{search_name}.svg"
-        map_path = os.path.join(self.maps_dir, map_file)
+        self._refresh_dir_cache()
         
-        if os.path.exists(map_path):
+        # Try direct match, ignoring case (most common case)
+        map_path = self._svg_lower_map.get(search_name.lower()) or self._svg_lower_map.get(map_name.lower())
+        if map_path:
             return map_path
         
-        # Try alternative case variations
-        for file in os.listdir(self.maps_dir):
-            file_base = os.path.splitext(file)[0]
-            if file_base.lower() == search_name.lower() or file_base.lower() == map_name.lower():
-                return os.path.join(self.maps_dir, file)
-        
         # Try removing spaces
         no_space_name = search_name.replace(" ", "")
-        map_file = f"{no_space_name}.svg"
-        map_path = os.path.join(self.maps_dir, map_file)
-        if os.path.exists(map_path):
+        map_path = self._svg_lower_map.get(no_space_name.lower())
+        if map_path:
             return map_path
         
         # Try to find official name if tarkovdata is available
-        if self.tarkov_data and self.tarkov_data.is_available():
-            official_map_info = self._get_official_map_info(map_name)
-            if official_map_info and "svg" in official_map_info and "file" in official_map_info["svg"]:
-                official_file = official_map_info["svg"]["file"]
-                official_path = os.path.join(self.maps_dir, official_file)
-                if os.path.exists(official_path):
-                    return official_path
+        official_map_info = self._get_official_map_info(map_name)
+        if official_map_info and "svg" in official_map_info and "file" in official_map_info["svg"]:
+            official_file = official_map_info["svg"]["file"]
+            official_path = self._svg_lower_map.get(os.path.splitext(official_file)[0].lower())
+            if official_path:
+                return official_path
         
         # If we still can't find the map, try searching for similar filenames
-        for file in os.listdir(self.maps_dir):
-            if file.endswith(".svg"):
-                file_base = os.path.splitext(file)[0]
-                # Check for substring matches or similar names
-                if (search_name.lower() in file_base.lower() or 
-                    file_base.lower() in search_name.lower() or
-                    map_name.lower() in file_base.lower() or
-                    file_base.lower() in map_name.lower()):
-                    logger.info(f"Found similar map file for '{map_name}': {file}")
-                    return os.path.join(self.maps_dir, file)
+        search_lower = search_name.lower()
+        map_lower = map_name.lower()
+        for file_base, file_path in self._svg_index:
+            # Check for substring matches or similar names
+            if (search_lower in file_base or 
+                file_base in search_lower or
+                map_lower in file_base or
+                file_base in map_lower):
+                logger.info(f"Found similar map file for '{map_name}': {os.path.basename(file_path)}")
+                return file_path
                 
         raise FileNotFoundError(f"Map file not found for {map_name}")
     
@@ -216,11 +243,7 @@ class MapDataManager:
         Returns:
             List of enemy types
         """
-        if not self.tarkov_data or not self.tarkov_data.is_available():
-            return []
-            
-        official_map_info = self._get_official_map_info(map_name)
-        if official_map_info and "enemies" in official_map_info:
+        if (official_map_info := self._get_official_map_info(map_name)) and "enemies" in official_map_info:
             return official_map_info["enemies"]
         return []
     
@@ -234,11 +257,7 @@ class MapDataManager:
         Returns:
             Dictionary with day and night raid durations in minutes
         """
-        if not self.tarkov_data or not self.tarkov_data.is_available():
-            return {"day": 0, "night": 0}
-            
-        official_map_info = self._get_official_map_info(map_name)
-        if official_map_info and "raidDuration" in official_map_info:
+        if (official_map_info := self._get_official_map_info(map_name)) and "raidDuration" in official_map_info:
             return official_map_info["raidDuration"]
         return {"day": 0, "night": 0}
     
@@ -252,11 +271,7 @@ class MapDataManager:
         Returns:
             Map description or empty string if not available
         """
-        if not self.tarkov_data or not self.tarkov_data.is_available():
-            return ""
-            
-        official_map_info = self._get_official_map_info(map_name)
-        if official_map_info and "description" in official_map_info:
+        if (official_map_info := self._get_official_map_info(map_name)) and "description" in official_map_info:
             return official_map_info["description"]
         return ""
     
@@ -270,11 +285,7 @@ class MapDataManager:
         Returns:
             Map wiki URL or None if not available
         """
-        if not self.tarkov_data or not self.tarkov_data.is_available():
-            return None
-            
-        official_map_info = self._get_official_map_info(map_name)
-        if official_map_info and "wiki" in official_map_info:
+        if (official_map_info := self._get_official_map_info(map_name)) and "wiki" in official_map_info:
             return official_map_info["wiki"]
         return None
     
@@ -288,41 +299,100 @@ class MapDataManager:
         Returns:
             Dictionary with map information or None if not found
         """
-        if not self.tarkov_data or not self.tarkov_data.is_available():
+        if not self._official_index_ready():
             return None
-            
+        
+        name = map_name.lower()
+        return self._maps_by_key.get(name) or self._maps_by_locale.get(name)
+    
+    def _official_index_ready(self) -> bool:
+        """
+        Make sure the official map indexes are built.
+        
+        Returns:
+            True if tarkovdata is available and indexed, False otherwise
+        """
+        if not self.tarkov_data or not self.tarkov_data.is_available():
+            return False
+        
+        if self._maps_by_key is None:
+            self._build_official_index()
+        return True
+    
+    def _build_official_index(self) -> None:
+        """Index official map information and configs by lowercased key and English locale name."""
         try:
             maps_data = self.tarkov_data.get_data("maps")
+        except Exception as e:
+            logger.warning(f"Could not retrieve maps from tarkovdata: {e}")
+            maps_data = {}
+        
+        maps_by_locale = {}
+        official_configs = {}
+        locale_configs = {}
+        for key, map_info in maps_data.items():
+            locale_name = None
+            if "locale" in map_info and "en" in map_info["locale"]:
+                locale_name = map_info["locale"]["en"].lower()
+                maps_by_locale.setdefault(locale_name, map_info)
             
-            # First try direct key match
-            if map_name.lower() in maps_data:
-                return maps_data[map_name.lower()]
+            config = self._convert_official_bounds(key, map_info)
+            if config is not None:
+                official_configs[key.lower()] = config
+                if locale_name:
+                    locale_configs.setdefault(locale_name, config)
+        
+        # Direct key matches take priority over locale name matches
+        for locale_name, config in locale_configs.items():
+            official_configs.setdefault(locale_name, config)
+        
+        # Assign the key index last; it doubles as the "index built" marker
+        self._maps_by_locale = maps_by_locale
+        self._official_configs = official_configs
+        self._maps_by_key = {key.lower(): map_info for key, map_info in maps_data.items()}
+    
+    @staticmethod
+    def _convert_official_bounds(map_key: str, map_info: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """
+        Convert official map bounds to our map configuration format.
+        
+        Args:
+            map_key: Key of the map in tarkovdata
+            map_info: Official map information
+            
+        Returns:
+            Dictionary containing map configuration values, or None if the
+            bounds are missing or use an unsupported coordinate rotation
+        """
+        try:
+            bounds = map_info["svg"]["bounds"]
+            rotation = map_info["svg"]["coordinateRotation"]
             
-            # Try to match by locale name
-            for key, map_info in maps_data.items():
-                if "locale" in map_info and "en" in map_info["locale"]:
-                    if map_info["locale"]["en"].lower() == map_name.lower():
-                        return map_info
+            # Only 180 degree rotation is supported
+            if rotation != 180:
+                logger.debug(f"Unsupported coordinate rotation for {map_key}: {rotation}")
+                return None
             
-            return None
-        except Exception:
+            return {
+                "centerMinX": bounds[1][0],
+                "centerMaxX": bounds[0][0],
+                "centerMinY": bounds[0][1],
+                "centerMaxY": bounds[1][1],
+                "pointMinX": bounds[1][0],
+                "pointMaxX": bounds[0][0],
+                "pointMinY": bounds[0][1],
+                "pointMaxY": bounds[1][1]
+            }
+        except (KeyError, IndexError, TypeError):
+            logger.debug(f"Could not extract bounds from official map info for {map_key}")
             return None
     
     @staticmethod
-    def _get_default_map_config() -> Dict[str, float]:
+    def _get_default_map_config() -> Mapping[str, float]:
         """
         Get default map configuration.
         
         Returns:
-            Dictionary with default map configuration values
+            Read-only mapping with default map configuration values
         """
-        return {
-            "centerMinX": -300,
-            "centerMaxX": 300,
-            "centerMinY": -300,
-            "centerMaxY": 300,
-            "pointMinX": -300,
-            "pointMaxX": 300,
-            "pointMinY": -300,
-            "pointMaxY": 300
-        }
\ No newline at end of file
+        return DEFAULT_MAP_CONFIG
\ No newline at end of file
@@ -4,12 +4,29 @@ General Tarkov data manager.
 This module provides access to various Tarkov game data from the tarkovdata project.
 """
 import os
+import re
 import json
+import pickle
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from ..file_cache import get_cache_path, write_cache_file
+from ..json_loader import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Set this environment variable to bypass the pickle cache of parsed data files
+DISABLE_PICKLE_CACHE_ENV = "TARKOV_DISABLE_PICKLE_CACHE"
+
+# Values of DISABLE_PICKLE_CACHE_ENV that turn the cache off
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
+# Number of single-item reads after which the whole items file is loaded instead
+ITEM_FULL_LOAD_THRESHOLD = 256
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
 class TarkovDataManager:
     """
     Manager for accessing Tarkov game data.
@@ -18,15 +35,24 @@ class TarkovDataManager:
     ammunition, quests, traders, etc.
     """
     
-    def __init__(self, data_dir: str = None):
+    def __init__(self, data_dir: str = None, cache_dir: str = None):
         """
         Initialize the Tarkov data manager.
         
         Args:
             data_dir: Directory containing Tarkov data files (optional)
+            cache_dir: Per-user directory for caching parsed data (optional)
         """
         self.data_dir = data_dir
+        self.cache_dir = cache_dir
         self.cache = {}
+        self._ammo_types = None
+        self._maps_list = None
+        self._items_path = None
+        self._item_offsets = None
+        self._item_reads = 0
+        # Serializes file loads so a background preload and the UI never parse twice
+        self._load_lock = threading.Lock()
         self.available = data_dir is not None and os.path.exists(data_dir)
         
         if not self.available:
@@ -53,38 +79,126 @@ class TarkovDataManager:
         if data_type in self.cache:
             return self.cache[data_type]
         
-        # Determine file path
-        file_name = f"{data_type}.json"
-        if data_type == "items":
-            file_name = "items.en.json"  # Special case for items
+        with self._load_lock:
+            # Another thread may have loaded it while we waited
+            if data_type in self.cache:
+                return self.cache[data_type]
             
-        file_path = os.path.join(self.data_dir, file_name)
+            # Determine file path
+            file_name = f"{data_type}.json"
+            if data_type == "items":
+                file_name = "items.en.json"  # Special case for items
+            
+            file_path = os.path.join(self.data_dir, file_name)
         
-        # Try to load from data directory
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            # Try to load from data directory
+            try:
+                data = self._load_file(file_path)
                 self.cache[data_type] = data
                 logger.info(f"Loaded {data_type} data from {file_path}")
                 return data
-        except FileNotFoundError:
-            # Try alternate location
-            alternate_path = os.path.join(self.data_dir, "Data", file_name)
-            try:
-                with open(alternate_path, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
+            except FileNotFoundError:
+                # Try alternate location
+                alternate_path = os.path.join(self.data_dir, "Data", file_name)
+                try:
+                    data = self._load_file(alternate_path)
                     self.cache[data_type] = data
                     logger.info(f"Loaded {data_type} data from {alternate_path}")
                     return data
+                except FileNotFoundError:
+                    logger.warning(f"Data file not found: {file_name}")
+                    self.cache[data_type] = {}  # Cache empty result to avoid repeated attempts
+                    return {}
+    
+    def _load_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Load a JSON data file, preferring its pickle cache in the cache directory.
+        
+        Args:
+            file_path: Path to the JSON data file
+            
+        Returns:
+            Parsed data from the file
+            
+        Raises:
+            FileNotFoundError: If the data file doesn't exist
+        """
+        cache_path = self._get_cache_path(file_path, ".pkl")
+        
+        if cache_path:
+            try:
+                with open(cache_path, 'rb') as file:
+                    return pickle.load(file)
             except FileNotFoundError:
-                logger.warning(f"Data file not found: {file_name}")
-                self.cache[data_type] = {}  # Cache empty result to avoid repeated attempts
-                return {}
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable data cache {cache_path}: {e}")
+        
+        with open(file_path, 'rb') as file:
+            data = _json_loads(file.read())
+        
+        if cache_path:
+            self._write_pickle_cache(cache_path, data)
+        return data
+    
+    def _get_cache_path(self, file_path: str, suffix: str) -> Optional[str]:
+        """
+        Get the cache file path for a data file.
+        
+        Caches only ever live in the per-user cache directory; files found in
+        the data directory are never unpickled.
+        
+        Args:
+            file_path: Path to the JSON data file
+            suffix: File name suffix of the cache file
+            
+        Returns:
+            Path of the cache file, or None if caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+        if os.environ.get(DISABLE_PICKLE_CACHE_ENV, "").strip().lower() in _TRUE_VALUES:
+            return None
+        return get_cache_path(os.path.join(self.cache_dir, "data"), file_path, suffix)
+    
+    @staticmethod
+    def _write_pickle_cache(cache_path: str, data: Dict[str, Any]) -> None:
+        """
+        Write parsed data to a pickle cache file.
+        
+        Args:
+            cache_path: Path of the cache file to write
+            data: Parsed data to store
+        """
+        def write(path):
+            with open(path, 'wb') as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        write_cache_file(cache_path, write)
+    
+    def preload(self, data_types: Iterable[str] = ("maps",)) -> None:
+        """
+        Load data types into the cache ahead of first use.
+        
+        Meant to be run from a background thread during startup. Large types
+        such as 'items' are best left to load on demand.
+        
+        Args:
+            data_types: Types of data to load (e.g., 'maps', 'ammunition')
+        """
+        for data_type in data_types:
+            try:
+                self.get_data(data_type)
+            except Exception as e:
+                logger.warning(f"Could not preload {data_type} data: {e}")
     
     def get_item_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
         """
         Get an item by its ID.
         
+        Until many items have been requested, only the JSON fragment for the
+        requested item is read, using a byte offset index of the items file.
+        
         Args:
             item_id: The ID of the item to get
             
@@ -95,12 +209,127 @@ class TarkovDataManager:
             return None
             
         try:
-            items = self.get_data("items")
-            return items.get(item_id)
+            if "items" in self.cache or self._item_reads >= ITEM_FULL_LOAD_THRESHOLD:
+                return self.get_data("items").get(item_id)
+            
+            item_offsets = self._get_item_offsets()
+            if item_offsets is None:
+                return self.get_data("items").get(item_id)
+            
+            span = item_offsets.get(item_id)
+            if span is None:
+                return None
+            
+            start, end = span
+            self._item_reads += 1
+            with open(self._items_path, 'rb') as file:
+                file.seek(start)
+                return _json_loads(file.read(end - start))
         except Exception:
             logger.warning(f"Could not find item with ID {item_id}")
             return None
     
+    def _get_item_offsets(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """
+        Get the byte offset index of the items file, building it if needed.
+        
+        Returns:
+            Dictionary mapping item IDs to (start, end) byte offsets, or None
+            if the items file doesn't exist
+        """
+        if self._item_offsets is not None:
+            return self._item_offsets
+        
+        with self._load_lock:
+            if self._item_offsets is not None:
+                return self._item_offsets
+            
+            for items_path in (
+                os.path.join(self.data_dir, "items.en.json"),
+                os.path.join(self.data_dir, "Data", "items.en.json"),
+            ):
+                if os.path.exists(items_path):
+                    break
+            else:
+                logger.warning("Data file not found: items.en.json")
+                return None
+            
+            index_path = self._get_cache_path(items_path, ".idx")
+            item_offsets = None
+            
+            if index_path:
+                try:
+                    with open(index_path, 'rb') as file:
+                        item_offsets = pickle.load(file)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable item index {index_path}: {e}")
+            
+            if item_offsets is None:
+                item_offsets = self._build_item_offset_index(items_path)
+                if index_path:
+                    self._write_pickle_cache(index_path, item_offsets)
+            
+            self._items_path = items_path
+            self._item_offsets = item_offsets
+            return item_offsets
+    
+    @staticmethod
+    def _build_item_offset_index(file_path: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Record the byte range of every top-level value in a JSON object file.
+        
+        Args:
+            file_path: Path to a JSON file containing a single object
+            
+        Returns:
+            Dictionary mapping each top-level key to its (start, end) byte offsets
+            
+        Raises:
+            ValueError: If the file is not a JSON object
+        """
+        with open(file_path, 'rb') as file:
+            raw = file.read()
+        text = raw.decode('utf-8')
+        is_ascii = len(text) == len(raw)
+        decoder = json.JSONDecoder()
+        
+        # Character offsets only equal byte offsets for pure ASCII files
+        char_pos = 0
+        byte_pos = 0
+        
+        def to_byte_offset(offset: int) -> int:
+            nonlocal char_pos, byte_pos
+            if is_ascii:
+                return offset
+            byte_pos += len(text[char_pos:offset].encode('utf-8'))
+            char_pos = offset
+            return byte_pos
+        
+        pos = _WHITESPACE.match(text, 0).end()
+        if text[pos:pos + 1] != "{":
+            raise ValueError(f"Expected a JSON object in {file_path}")
+        pos += 1
+        
+        offsets = {}
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if text[pos:pos + 1] == "}":
+                break
+            key, pos = decoder.raw_decode(text, pos)
+            pos = _WHITESPACE.match(text, pos).end()
+            if text[pos:pos + 1] != ":":
+                raise ValueError(f"Malformed JSON object in {file_path}")
+            start = _WHITESPACE.match(text, pos + 1).end()
+            _, end = decoder.raw_decode(text, start)
+            offsets[key] = (to_byte_offset(start), to_byte_offset(end))
+            pos = _WHITESPACE.match(text, end).end()
+            if text[pos:pos + 1] == ",":
+                pos += 1
+        
+        return offsets
+    
     def get_ammo_types(self) -> List[Dict[str, Any]]:
         """
         Get all ammunition types.
@@ -110,10 +339,14 @@ class TarkovDataManager:
         """
         if not self.available:
             return []
+        
+        if self._ammo_types is not None:
+            return list(self._ammo_types)
             
         try:
             ammo_data = self.get_data("ammunition")
-            return list(ammo_data.values())
+            self._ammo_types = tuple(ammo_data.values())
+            return list(self._ammo_types)
         except Exception:
             logger.warning("Could not load ammunition data")
             return []
@@ -127,10 +360,14 @@ class TarkovDataManager:
         """
         if not self.available:
             return []
+        
+        if self._maps_list is not None:
+            return list(self._maps_list)
             
         try:
             maps_data = self.get_data("maps")
-            return list(maps_data.keys())
+            self._maps_list = tuple(maps_data.keys())
+            return list(self._maps_list)
         except Exception:
             logger.warning("Could not load maps data")
             return []
@@ -0,0 +1,88 @@
+"""
+File cache helpers for the Tarkov Map Assistant.
+
+Cache files are named after the source file they were made from, followed by
+the source's version (modification time and size). Edited sources therefore
+get new cache files, and files made from older versions are removed when a
+new one is written.
+"""
+import os
+import hashlib
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+def get_cache_path(cache_dir: str, source_path: str, suffix: str) -> Optional[str]:
+    """
+    Get the cache file path for data made from a source file.
+    
+    Args:
+        cache_dir: Directory holding the cache files
+        source_path: Path of the file the cached data is made from
+        suffix: File name suffix starting with ".", which may carry a variant
+            of the cached data (e.g. ".w1000.png")
+    
+    Returns:
+        Path of the cache file, or None if the source file cannot be read
+    """
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        return None
+    
+    source_key = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()
+    file_name = f"{source_key}-{stat.st_mtime_ns:x}-{stat.st_size:x}{suffix}"
+    return os.path.join(cache_dir, file_name)
+
+def write_cache_file(cache_path: str, write: Callable[[str], None]) -> bool:
+    """
+    Atomically write a cache file and remove caches of older source versions.
+    
+    Errors are logged rather than raised, since caches are only an optimization.
+    
+    Args:
+        cache_path: Path from get_cache_path
+        write: Function that writes the cached data to the path it is given
+    
+    Returns:
+        True if the cache file was written
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        write(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write cache file {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    
+    _remove_old_versions(cache_path)
+    return True
+
+def _remove_old_versions(cache_path: str) -> None:
+    """
+    Remove cache files made from other versions of a cache file's source.
+    
+    Args:
+        cache_path: Path of the current cache file
+    """
+    cache_dir, file_name = os.path.split(cache_path)
+    source_key, version = file_name.split(".", 1)[0].split("-", 1)
+    prefix = f"{source_key}-"
+    
+    try:
+        with os.scandir(cache_dir) as entries:
+            old_paths = [
+                entry.path for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name[len(prefix):].split(".", 1)[0] != version
+            ]
+        for old_path in old_paths:
+            os.remove(old_path)
+    except OSError as e:
+        logger.debug(f"Could not remove old cache files in {cache_dir}: {e}")
@@ -4,24 +4,48 @@ GUI module for the Tarkov Map Assistant.
 This module provides the graphical user interface for the application.
 """
 import os
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import webbrowser
+import xml.etree.ElementTree as ElementTree
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 from PIL import Image
 from tksvg import SvgImage  # Changed from tkSvg to tksvg (lowercase 's')
 
+from .file_cache import get_cache_path, write_cache_file
 from .screenshot_handler import ScreenshotHandler, Coordinates
 from .data_manager import MapDataManager
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Outline colors for the player marker pulse, fading from 80% red towards black
+_PULSE_COLORS = tuple(f"#{int(255 * (0.8 - i * 0.05)):02x}0000" for i in range(16))
+
+# Radius of the player marker and of the pulsing rings around it
+_MARKER_SIZE = 8
+_RING_SIZES = (_MARKER_SIZE + 5, _MARKER_SIZE + 10, _MARKER_SIZE + 15)
+
+# Cursors shown while panning a map, by (pans horizontally, pans vertically)
+_PAN_CURSORS = {
+    (True, True): "fleur",
+    (True, False): "sb_h_double_arrow",
+    (False, True): "sb_v_double_arrow",
+}
+
+# Display size of map icons
+_ICON_SIZE = (24, 24)
+
+# Map name variations that are hidden when "Labs" is available
+_LABS_VARIANTS = frozenset(("Lab", "The Lab"))
+
 class TarkovMapApp:
     """Main application class for the Tarkov Map Assistant GUI."""
     
-    def __init__(self, screenshot_handler, map_data, icons_dir):
+    def __init__(self, screenshot_handler, map_data, icons_dir, cache_dir=None):
         """
         Initialize the application.
         
@@ -29,15 +53,44 @@ class TarkovMapApp:
             screenshot_handler: ScreenshotHandler instance
             map_data: MapDataManager instance
             icons_dir: Directory containing map icons
+            cache_dir: Directory for caching rendered maps (optional)
         """
         self.screenshot_handler = screenshot_handler
         self.map_data = map_data
         self.icons_dir = icons_dir
+        self.cache_dir = cache_dir
         
         self.root = None
         self.icons = {}
+        self._icon_futures = {}  # Pending icon decodes, by lowercase file stem
+        self._svg_cache = {}  # Rendered map images for this session, by (map path, width)
+        self._svg_widths = {}  # Native SVG widths in pixels, by map path
+        self._map_windows = {}  # Open map windows as (window, canvas, position label), by map name
+        self._transform_cache = {}  # Coordinate transforms, by (map name, width, height)
         self.status_bar = None
         self.position_label = None
+        self._pending_status = ""
+        self._status_scheduled = False
+        
+        # Shared fonts and placeholder icon, created once the root window exists
+        self._font_large_title = None
+        self._font_title = None
+        self._font_heading = None
+        self._font_body = None
+        self._font_small = None
+        self._font_bold = None
+        self._blank_icon = None
+        
+        # Map menu entries and map buttons are built on first display
+        self._maps_menu = None
+        self._maps_menu_built = False
+        self._maps_grid_built = False
+        
+        # Map lists are computed on first use and reused by every view
+        self._available_set = None
+        self._maps_sorted = None
+        self._maps_sorted_filtered = None
+        self._tooltip_cache = {}  # Tooltip text by map name, filled on first use
         
         # Set customtkinter appearance mode
         ctk.set_appearance_mode("System")
@@ -50,11 +103,28 @@ class TarkovMapApp:
         self.root.geometry("500x700")
         self.root.resizable(True, True)
         
+        self._create_shared_resources()
+        
+        # Decode icons in the background while the interface is built
+        self._start_icon_decoding()
+        
         self._setup_menu()
         self._create_main_interface()
         
         self.root.mainloop()
     
+    def _create_shared_resources(self):
+        """Create the fonts and placeholder icon shared by all widgets."""
+        self._font_large_title = ctk.CTkFont(size=20, weight="bold")
+        self._font_title = ctk.CTkFont(size=16, weight="bold")
+        self._font_heading = ctk.CTkFont(size=14, weight="bold")
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_small = ctk.CTkFont(size=10)
+        self._font_bold = ctk.CTkFont(weight="bold")
+        
+        # Transparent stand-in for maps without an icon
+        self._blank_icon = ctk.CTkImage(Image.new("RGBA", (1, 1)), size=_ICON_SIZE)
+    
     def _setup_menu(self):
         """Set up the application menu."""
         menu_bar = tk.Menu(self.root)
@@ -71,32 +141,9 @@ class TarkovMapApp:
         view_menu.add_command(label="Coordinate History", command=self._show_coord_history)
         menu_bar.add_cascade(label="View", menu=view_menu)
         
-        # Maps menu
-        maps_menu = tk.Menu(menu_bar, tearoff=0)
-        
-        # Add maps from our data manager with special handling for variants
-        available_maps = sorted(self.map_data.get_available_maps())
-        
-        # Filter out duplicate maps with different naming variations
-        filtered_maps = []
-        skip_maps = ["Lab", "The Lab"]  # Prefer "Labs" over these variations
-        
-        for map_name in available_maps:
-            # Skip certain variations if we have the preferred name
-            if "Labs" in available_maps and map_name in skip_maps:
-                continue
-            if "StreetsOfTarkov" in available_maps and map_name == "Streets of Tarkov":
-                continue
-            filtered_maps.append(map_name)
-        
-        # Add maps to menu
-        for map_name in filtered_maps:
-            maps_menu.add_command(
-                label=map_name,
-                command=lambda m=map_name: self._show_map(m)
-            )
-        
-        menu_bar.add_cascade(label="Maps", menu=maps_menu)
+        # Maps menu, populated when first opened
+        self._maps_menu = tk.Menu(menu_bar, tearoff=0, postcommand=self._populate_maps_menu)
+        menu_bar.add_cascade(label="Maps", menu=self._maps_menu)
         
         # Settings menu
         settings_menu = tk.Menu(menu_bar, tearoff=0)
@@ -112,6 +159,20 @@ class TarkovMapApp:
         
         self.root.config(menu=menu_bar)
     
+    def _populate_maps_menu(self):
+        """Add map entries to the Maps menu the first time it is opened."""
+        if self._maps_menu_built:
+            return
+        self._maps_menu_built = True
+        
+        self._maps_menu.delete(0, "end")
+        self._ensure_map_lists()
+        for map_name in self._maps_sorted_filtered:
+            self._maps_menu.add_command(
+                label=map_name,
+                command=functools.partial(self._show_map, map_name)
+            )
+    
     def _create_main_interface(self):
         """Create the main application interface."""
         # Main frame
@@ -133,14 +194,14 @@ class TarkovMapApp:
         coords_label = ctk.CTkLabel(
             coords_frame, 
             text="Current Position:", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_heading
         )
         coords_label.pack(pady=5)
         
         self.position_label = ctk.CTkLabel(
             coords_frame, 
             text="No coordinates loaded",
-            font=ctk.CTkFont(size=12)
+            font=self._font_body
         )
         self.position_label.pack(pady=5)
         
@@ -148,7 +209,7 @@ class TarkovMapApp:
         maps_label = ctk.CTkLabel(
             main_frame, 
             text="Select Map:", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_title
         )
         maps_label.pack(pady=(20, 10))
         
@@ -156,75 +217,87 @@ class TarkovMapApp:
         maps_scroll_frame = ctk.CTkScrollableFrame(main_frame)
         maps_scroll_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
+        # Map buttons are created once the list is first shown
+        maps_scroll_frame.bind("<Map>", lambda _event: self._build_maps_grid(maps_scroll_frame), add="+")
+        
+        # Status bar
+        status_bar = ctk.CTkLabel(self.root, text="Ready", anchor="w")
+        status_bar.pack(side="bottom", fill="x", padx=5, pady=2)
+        self.status_bar = status_bar
+        
+        # Update coordinates display if available
+        self._update_coordinates_display()
+    
+    def _build_maps_grid(self, parent):
+        """
+        Create the map button grid the first time the maps list is shown.
+        
+        Args:
+            parent: Frame to place the map grid in
+        """
+        if self._maps_grid_built:
+            return
+        self._maps_grid_built = True
+        
         # Load map icons
         self._load_map_icons()
         
-        # Create map buttons
-        available_maps = self.map_data.get_available_maps()
-        
         # Create map category frames
-        official_maps_frame = ctk.CTkFrame(maps_scroll_frame)
+        official_maps_frame = ctk.CTkFrame(parent)
         official_maps_frame.pack(fill="x", padx=5, pady=5)
         
         ctk.CTkLabel(
             official_maps_frame, 
             text="Official Maps", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_heading
         ).pack(anchor="w", pady=5)
         
         maps_grid = ctk.CTkFrame(official_maps_frame)
         maps_grid.pack(fill="x", padx=5, pady=5)
         
+        # One shared label shows the details of whichever map is hovered
+        map_info_hint = "Hover over a map for details"
+        map_info_label = ctk.CTkLabel(
+            official_maps_frame,
+            text=map_info_hint,
+            font=self._font_small,
+            justify="left",
+            wraplength=400,
+            height=32
+        )
+        map_info_label.pack(padx=10, pady=(0, 5), anchor="w")
+        
+        def clear_map_info(_event):
+            map_info_label.configure(text=map_info_hint)
+        
         # Create buttons for each map
         button_count = 0
         col_count = 2  # Number of columns in the grid
         
-        # Filter out duplicate maps to avoid clutter
-        filtered_maps = []
-        skip_maps = ["Lab", "The Lab"]  # Prefer "Labs" over these variations
-        
-        for map_name in sorted(available_maps):
-            # Skip certain variations if we have the preferred name
-            if "Labs" in available_maps and map_name in skip_maps:
-                continue
-            if "StreetsOfTarkov" in available_maps and map_name == "Streets of Tarkov":
-                continue
-            filtered_maps.append(map_name)
-        
-        for index, map_name in enumerate(filtered_maps):
-            # Create a button frame for each map button
-            button_frame = ctk.CTkFrame(maps_grid)
-            button_frame.grid(
-                row=button_count // col_count, 
-                column=button_count % col_count, 
-                padx=5, pady=5, 
-                sticky="ew"
-            )
-            
+        self._ensure_map_lists()
+        for map_name in self._maps_sorted_filtered:
             # Map button
             button = ctk.CTkButton(
-                button_frame,
+                maps_grid,
                 text=map_name,
-                image=self.icons.get(map_name),
+                image=self.icons.get(map_name, self._blank_icon),
                 compound="left",
-                command=lambda mn=map_name: self._show_map(mn),
+                command=functools.partial(self._show_map, map_name),
                 width=200,
                 height=40
             )
-            button.pack(fill="x", padx=5, pady=5)
+            button.grid(
+                row=button_count // col_count, 
+                column=button_count % col_count, 
+                padx=10, pady=5, 
+                sticky="ew"
+            )
             
-            # Get map info for the tooltip
+            # Show the map info while the button is hovered
             map_info = self._get_map_tooltip(map_name)
             if map_info:
-                # Create tooltip label
-                tooltip_label = ctk.CTkLabel(
-                    button_frame,
-                    text=map_info,
-                    font=ctk.CTkFont(size=10),
-                    justify="left",
-                    wraplength=190
-                )
-                tooltip_label.pack(padx=5, pady=(0, 5), anchor="w")
+                button.bind("<Enter>", functools.partial(self._show_map_info, map_info_label, map_info))
+                button.bind("<Leave>", clear_map_info)
             
             # Increment count
             button_count += 1
@@ -232,14 +305,47 @@ class TarkovMapApp:
         # Make columns responsive
         for i in range(col_count):
             maps_grid.columnconfigure(i, weight=1)
+    
+    @staticmethod
+    def _show_map_info(label, map_info, _event=None):
+        """
+        Show map details in the shared map info label.
         
-        # Status bar
-        status_bar = ctk.CTkLabel(self.root, text="Ready", anchor="w")
-        status_bar.pack(side="bottom", fill="x", padx=5, pady=2)
-        self.status_bar = status_bar
+        Args:
+            label: The map info label
+            map_info: Text to show
+        """
+        label.configure(text=map_info)
+    
+    def _ensure_map_lists(self):
+        """Compute the map lists shared by every view the first time one is needed."""
+        if self._maps_sorted is not None:
+            return
         
-        # Update coordinates display if available
-        self._update_coordinates_display()
+        # Deferred from __init__ so the map data preload overlaps window setup
+        available_maps = self.map_data.get_available_maps()
+        self._available_set = frozenset(available_maps)
+        self._maps_sorted = tuple(sorted(available_maps))
+        self._maps_sorted_filtered = tuple(self._filter_maps(self._maps_sorted))
+    
+    def _filter_maps(self, map_names):
+        """
+        Filter out duplicate maps with different naming variations.
+        
+        Args:
+            map_names: Map names to filter
+            
+        Returns:
+            List of map names without duplicate variations
+        """
+        # Skip certain variations if we have the preferred name
+        skip_maps = set()
+        if "Labs" in self._available_set:
+            skip_maps |= _LABS_VARIANTS
+        if "StreetsOfTarkov" in self._available_set:
+            skip_maps.add("Streets of Tarkov")
+        
+        return [map_name for map_name in map_names if map_name not in skip_maps]
     
     def _get_map_tooltip(self, map_name):
         """
@@ -251,6 +357,9 @@ class TarkovMapApp:
         Returns:
             Tooltip text with map info
         """
+        if map_name in self._tooltip_cache:
+            return self._tooltip_cache[map_name]
+        
         tooltip_parts = []
         
         # Get raid duration if available
@@ -264,30 +373,78 @@ class TarkovMapApp:
             enemies_text = ", ".join(enemies)
             tooltip_parts.append(f"Enemies: {enemies_text}")
         
-        # Return tooltip if we have any info, otherwise None
-        if tooltip_parts:
-            return "\n".join(tooltip_parts)
-        return None
+        # Cache tooltip if we have any info, otherwise None
+        tooltip = "\n".join(tooltip_parts) if tooltip_parts else None
+        self._tooltip_cache[map_name] = tooltip
+        return tooltip
+    
+    def _start_icon_decoding(self):
+        """Start decoding map icon files on worker threads."""
+        self._icon_futures = {}
+        
+        # Index the icons directory once instead of probing each candidate name
+        try:
+            with os.scandir(self.icons_dir) as entries:
+                icon_index = {
+                    entry.name.lower(): entry.path
+                    for entry in entries
+                    if entry.name.lower().endswith(".png") and entry.is_file()
+                }
+        except OSError as e:
+            logger.error(f"Error reading icons directory {self.icons_dir}: {e}")
+            return
+        
+        # Decode every icon so this does not wait for the map list to load
+        executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="icon-decode")
+        for icon_name, icon_path in icon_index.items():
+            self._icon_futures[icon_name[:-len(".png")]] = executor.submit(
+                self._decode_icon, icon_path
+            )
+        
+        # Queued decodes still run; this only releases the workers when done
+        executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _decode_icon(icon_path):
+        """
+        Read and decode an icon image file.
+        
+        Icons are reduced to display size and RGBA here, so CTkImage has no
+        conversion work left to do on the main thread.
+        
+        Args:
+            icon_path: Path to the icon file
+            
+        Returns:
+            Fully decoded PIL image
+        """
+        image = Image.open(icon_path)
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        else:
+            image.load()
+        
+        if image.width > _ICON_SIZE[0] or image.height > _ICON_SIZE[1]:
+            image.thumbnail(_ICON_SIZE)
+        return image
     
     def _load_map_icons(self):
-        """Load map icons from the icons directory."""
+        """Create map icons from the decoded icon images."""
         self.icons = {}
-        for map_name in self.map_data.get_available_maps():
+        self._ensure_map_lists()
+        for map_name in self._maps_sorted_filtered:
             # Try a few potential file names
-            icon_paths = [
-                os.path.join(self.icons_dir, f"{map_name}.png"),
-                os.path.join(self.icons_dir, f"{map_name.lower()}.png"),
-                os.path.join(self.icons_dir, f"{map_name.replace(' ', '')}.png")
-            ]
-            
-            for icon_path in icon_paths:
-                if os.path.exists(icon_path):
-                    try:
-                        icon_image = ctk.CTkImage(Image.open(icon_path), size=(24, 24))
-                        self.icons[map_name] = icon_image
-                        break
-                    except Exception as e:
-                        logger.error(f"Error loading icon for {map_name}: {e}")
+            future = (
+                self._icon_futures.get(map_name.lower())
+                or self._icon_futures.get(map_name.replace(' ', '').lower())
+            )
+            if future is None:
+                continue
+            try:
+                # CTkImage touches Tk, so it is created here on the main thread
+                self.icons[map_name] = ctk.CTkImage(future.result(), size=_ICON_SIZE)
+            except Exception as e:
+                logger.error(f"Error loading icon for {map_name}: {e}")
     
     def _update_coordinates_display(self):
         """Update the coordinates display with the latest coordinates."""
@@ -322,16 +479,21 @@ class TarkovMapApp:
             logger.error(f"Error processing screenshot: {e}")
             messagebox.showerror("Error", str(e))
     
-    def _show_map(self, map_name):
+    def _show_map(self, map_name, coords_override=None):
         """
         Display a map in a new window.
         
         Args:
             map_name: Name of the map to display
+            coords_override: Coordinates to show instead of the latest ones (optional)
         """
+        new_window = None
         try:
-            # Get latest coordinates
-            coords = self.screenshot_handler.get_latest_coordinates()
+            # Get coordinates to show, defaulting to the latest
+            if coords_override is not None:
+                coords = coords_override
+            else:
+                coords = self.screenshot_handler.get_latest_coordinates()
             if not coords:
                 messagebox.showwarning(
                     "No Coordinates", 
@@ -339,6 +501,21 @@ class TarkovMapApp:
                 )
                 return
             
+            position_text = f"Player Position: X: {coords.x:.1f}, Y: {coords.y:.1f}, Z: {coords.z:.1f}"
+            
+            # Reuse the map's window if it is still open, moving the marker
+            window_info = self._map_windows.get(map_name)
+            if window_info and window_info[0].winfo_exists():
+                map_window, canvas, position_label = window_info
+                position_label.configure(text=position_text)
+                canvas.player_coords = coords
+                if canvas.marker_id is not None:
+                    self._update_marker(canvas, map_name)
+                map_window.deiconify()
+                map_window.lift()
+                map_window.focus()
+                return
+            
             # Get map file path
             try:
                 map_path = self.map_data.get_map_file_path(map_name)
@@ -347,7 +524,7 @@ class TarkovMapApp:
                 return
             
             # Create map window
-            map_window = ctk.CTkToplevel(self.root)
+            map_window = new_window = ctk.CTkToplevel(self.root)
             map_window.title(f"Map: {map_name}")
             map_window.geometry("1000x800")
             map_window.resizable(True, True)
@@ -373,12 +550,11 @@ class TarkovMapApp:
                 wiki_button = ctk.CTkButton(
                     toolbar,
                     text="Open Wiki",
-                    command=lambda: webbrowser.open(wiki_url)
+                    command=functools.partial(webbrowser.open, wiki_url)
                 )
                 wiki_button.pack(side="right", padx=10, pady=5)
             
             # Player position label
-            position_text = f"Player Position: X: {coords.x:.1f}, Y: {coords.y:.1f}, Z: {coords.z:.1f}"
             position_label = ctk.CTkLabel(
                 toolbar,
                 text=position_text
@@ -391,117 +567,326 @@ class TarkovMapApp:
             
             canvas = tk.Canvas(canvas_frame, width=1000, height=700, bg="#333333")
             canvas.pack(fill="both", expand=True)
+            canvas.player_coords = coords
+            canvas.marker_id = None
+            self._map_windows[map_name] = (map_window, canvas, position_label)
+            
+            # Load the map, down-sampled to the canvas width if it is larger
+            canvas.update_idletasks()
+            canvas_width = canvas.winfo_width()
+            if canvas_width <= 1:
+                canvas_width = int(canvas["width"])
+            
+            render_width = canvas_width
+            native_width = self._get_svg_width(map_path)
+            if native_width:
+                render_width = min(native_width, canvas_width)
+            
+            self._render_map(canvas, map_name, map_path, render_width)
             
-            # Load SVG map
+        except Exception as e:
+            logger.error(f"Error showing map {map_name}: {e}")
+            if new_window is not None:
+                self._discard_map_window(map_name, new_window)
+            messagebox.showerror("Error", f"Could not load map: {e}")
+    
+    def _discard_map_window(self, map_name, map_window):
+        """
+        Unregister and close a map window whose map could not be shown.
+        
+        Args:
+            map_name: Name of the map
+            map_window: The map window
+        """
+        window_info = self._map_windows.get(map_name)
+        if window_info and window_info[0] is map_window:
+            del self._map_windows[map_name]
+        if map_window.winfo_exists():
+            map_window.destroy()
+    
+    def _render_map(self, canvas, map_name, map_path, width):
+        """
+        Render a map onto a canvas, showing a placeholder until it is drawn.
+        
+        tksvg rasterizes through Tk, so rendering runs on the main thread and
+        the interface is unresponsive until it finishes. Starting it from an
+        idle callback only lets the window and placeholder be drawn first;
+        the PNG cache is what makes later loads of the same map fast.
+        
+        Args:
+            canvas: Canvas to draw the map on
+            map_name: Name of the map
+            map_path: Path to the map SVG file
+            width: Width in pixels to rasterize the map at
+        """
+        image = self._svg_cache.get((map_path, width))
+        if image is not None:
+            self._draw_map(canvas, map_name, image)
+            return
+        
+        loading_id = canvas.create_text(
+            width / 2, int(canvas["height"]) / 2,
+            text="Loading…", fill="white", font=self._font_title
+        )
+        
+        def render():
+            if not canvas.winfo_exists():
+                return
+            
+            canvas.delete(loading_id)
             try:
-                svg_image = SvgImage(master=canvas, file=map_path)
-                svg_id = canvas.create_image(0, 0, anchor='nw', image=svg_image)
-                
-                # Get SVG dimensions
-                svg_width = svg_image.width()
-                svg_height = svg_image.height()
-                
-                # Get map config and calculate point position
-                map_config = self.map_data.get_map_config(map_name)
-                
-                # Calculate center point
-                center_x = (map_config["centerMaxX"] + map_config["centerMinX"]) / 2
-                center_y = (map_config["centerMaxY"] + map_config["centerMinY"]) / 2
-                
-                # Calculate scale factors
-                scale_x = svg_width / (map_config["pointMaxX"] - map_config["pointMinX"])
-                scale_y = svg_height / (map_config["pointMaxY"] - map_config["pointMinY"])
-                
-                # Convert game coordinates to map coordinates
-                real_x = svg_width / 2 - ((coords.x - center_x) * scale_x)
-                real_y = svg_height / 2 + ((coords.z - center_y) * scale_y)
-                
-                # Draw player position marker
-                marker_size = 8
-                canvas.create_oval(
-                    real_x - marker_size, real_y - marker_size,
-                    real_x + marker_size, real_y + marker_size,
-                    fill="red", outline="white", width=2, tags=("player_position",)
-                )
-                
-                # Add a pulsing effect circle
-                for i in range(3):
-                    size = marker_size + (i+1) * 5
-                    canvas.create_oval(
-                        real_x - size, real_y - size,
-                        real_x + size, real_y + size,
-                        outline="red", width=2, tags=("player_effect",)
-                    )
-                
-                # Pulse animation
-                def pulse_effect():
-                    alpha = 0.8
-                    fade_step = 0.05
-                    
-                    def fade_out():
-                        nonlocal alpha
-                        if alpha > 0:
-                            for item in canvas.find_withtag("player_effect"):
-                                canvas.itemconfig(item, outline=f"#{int(255*alpha):02x}0000")
-                            alpha -= fade_step
-                            canvas.after(50, fade_out)
-                        else:
-                            alpha = 0.8
-                            for item in canvas.find_withtag("player_effect"):
-                                canvas.itemconfig(item, outline="red")
-                            canvas.after(1000, fade_out)
-                    
-                    fade_out()
-                
-                pulse_effect()
-                
-                # Add pan functionality (no zoom)
-                self._add_canvas_controls(canvas)
-                
-                # Store reference to prevent garbage collection
-                canvas.svg_image = svg_image
-                
+                image = self._load_map_image(map_path, width)
+                self._draw_map(canvas, map_name, image)
             except Exception as e:
                 logger.error(f"Error rendering map {map_name}: {e}")
+                # Otherwise the empty window would be reused for this map
+                self._discard_map_window(map_name, canvas.winfo_toplevel())
                 messagebox.showerror("Error", f"Could not render map: {e}")
+        
+        canvas.update_idletasks()
+        canvas.after_idle(render)
+    
+    def _draw_map(self, canvas, map_name, image):
+        """
+        Draw a rendered map and the player marker on a canvas.
+        
+        The marker is drawn at the canvas's player_coords.
+        
+        Args:
+            canvas: Canvas to draw on
+            map_name: Name of the map
+            image: Tk image of the rendered map
+        """
+        canvas.create_image(0, 0, anchor='nw', image=image)
+        
+        # Store reference to prevent garbage collection
+        canvas.svg_image = image
+        canvas.config(scrollregion=(0, 0, image.width(), image.height()))
+        
+        # Create the player position marker and pulsing effect circles once;
+        # later positions only move them
+        canvas.marker_id = canvas.create_oval(
+            0, 0, 0, 0,
+            fill="red", outline="white", width=2, tags=("player_position",)
+        )
+        canvas.effect_ids = [
+            canvas.create_oval(0, 0, 0, 0, outline="red", width=2, tags=("player_effect",))
+            for _ in _RING_SIZES
+        ]
+        self._update_marker(canvas, map_name)
+        
+        # Pulse animation
+        def pulse_effect():
+            step = 0
+            
+            def fade_out():
+                nonlocal step
+                if step < len(_PULSE_COLORS):
+                    canvas.itemconfigure("player_effect", outline=_PULSE_COLORS[step])
+                    step += 1
+                    canvas.after(50, fade_out)
+                else:
+                    step = 0
+                    canvas.itemconfigure("player_effect", outline="red")
+                    canvas.after(1000, fade_out)
+            
+            fade_out()
+        
+        pulse_effect()
+        
+        # Add pan functionality (no zoom)
+        self._add_canvas_controls(canvas)
+    
+    def _update_marker(self, canvas, map_name):
+        """
+        Move the player marker to the canvas's player_coords.
+        
+        Args:
+            canvas: Canvas the map is drawn on
+            map_name: Name of the map
+        """
+        coords = canvas.player_coords
+        
+        # Convert game coordinates to map coordinates
+        half_width, half_height, center_x, center_y, scale_x, scale_y = (
+            self._get_map_transform(map_name, canvas.svg_image.width(), canvas.svg_image.height())
+        )
+        real_x = half_width - (coords.x - center_x) * scale_x
+        real_y = half_height + (coords.z - center_y) * scale_y
+        
+        canvas.coords(
+            canvas.marker_id,
+            real_x - _MARKER_SIZE, real_y - _MARKER_SIZE,
+            real_x + _MARKER_SIZE, real_y + _MARKER_SIZE
+        )
+        for effect_id, size in zip(canvas.effect_ids, _RING_SIZES):
+            canvas.coords(effect_id, real_x - size, real_y - size, real_x + size, real_y + size)
+    
+    def _get_svg_width(self, map_path):
+        """
+        Get the native width of a map SVG, read once per map.
+        
+        Args:
+            map_path: Path to the map SVG file
+            
+        Returns:
+            Width in pixels from the SVG's viewBox or width attribute, or None
+            if it cannot be determined
+        """
+        if map_path not in self._svg_widths:
+            self._svg_widths[map_path] = self._read_svg_width(map_path)
+        return self._svg_widths[map_path]
+    
+    @staticmethod
+    def _read_svg_width(map_path):
+        """
+        Read the native width from the root element of an SVG file.
+        
+        Args:
+            map_path: Path to the SVG file
+            
+        Returns:
+            Width in whole pixels, or None if it cannot be determined
+        """
+        try:
+            # Only the root element is needed, so stop at the first start tag
+            for _event, element in ElementTree.iterparse(map_path, events=("start",)):
+                view_box = element.get("viewBox", "").replace(",", " ").split()
+                if len(view_box) == 4:
+                    return int(float(view_box[2]))
                 
-        except Exception as e:
-            logger.error(f"Error showing map {map_name}: {e}")
-            messagebox.showerror("Error", f"Could not load map: {e}")
+                width = element.get("width", "")
+                if width.endswith("px"):
+                    width = width[:-2]
+                return int(float(width)) if width else None
+        except (OSError, ElementTree.ParseError, ValueError) as e:
+            logger.debug(f"Could not read SVG width of {map_path}: {e}")
+        return None
+    
+    def _load_map_image(self, map_path, width):
+        """
+        Load a rendered map image, reusing earlier renders when possible.
+        
+        SVG rendering is slow, so rendered maps are kept for the session and
+        saved as PNG files in the cache directory for later sessions.
+        
+        Args:
+            map_path: Path to the map SVG file
+            width: Width in pixels to rasterize the map at
+            
+        Returns:
+            Tk image of the rendered map
+        """
+        cache_key = (map_path, width)
+        image = self._svg_cache.get(cache_key)
+        if image is not None:
+            return image
+        
+        png_path = self._get_map_cache_path(map_path, width)
+        if png_path and os.path.exists(png_path):
+            try:
+                image = tk.PhotoImage(master=self.root, file=png_path)
+            except tk.TclError as e:
+                logger.warning(f"Could not load cached map image {png_path}: {e}")
+        
+        if image is None:
+            image = SvgImage(master=self.root, file=map_path, scaletowidth=width)
+            if png_path:
+                write_cache_file(png_path, functools.partial(image.write, format="png"))
+        
+        self._svg_cache[cache_key] = image
+        return image
+    
+    def _get_map_cache_path(self, map_path, width):
+        """
+        Get the cache file path for a rendered map.
+        
+        Args:
+            map_path: Path to the map SVG file
+            width: Width in pixels the map is rasterized at
+            
+        Returns:
+            Path of the PNG cache file, or None if caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+        return get_cache_path(os.path.join(self.cache_dir, "maps"), map_path, f".w{width}.png")
+    
+    def _get_map_transform(self, map_name, svg_width, svg_height):
+        """
+        Get the constants for converting game coordinates to map pixels.
+        
+        The values only depend on the map config and rendered size, so they
+        are computed once per map and size.
+        
+        Args:
+            map_name: Name of the map
+            svg_width: Width of the rendered map in pixels
+            svg_height: Height of the rendered map in pixels
+            
+        Returns:
+            Tuple of (half_width, half_height, center_x, center_y, scale_x, scale_y)
+        """
+        key = (map_name, svg_width, svg_height)
+        transform = self._transform_cache.get(key)
+        if transform is None:
+            map_config = self.map_data.get_map_config(map_name)
+            
+            # Calculate center point
+            center_x = (map_config["centerMaxX"] + map_config["centerMinX"]) / 2
+            center_y = (map_config["centerMaxY"] + map_config["centerMinY"]) / 2
+            
+            # Calculate scale factors
+            scale_x = svg_width / (map_config["pointMaxX"] - map_config["pointMinX"])
+            scale_y = svg_height / (map_config["pointMaxY"] - map_config["pointMinY"])
+            
+            transform = (svg_width / 2, svg_height / 2, center_x, center_y, scale_x, scale_y)
+            self._transform_cache[key] = transform
+        
+        return transform
     
     def _add_canvas_controls(self, canvas):
         """
         Add pan controls to a canvas.
         
+        Maps are rendered no wider than the canvas, so the map can only be
+        dragged along the axes where it is larger than the canvas, e.g.
+        vertically on tall maps or horizontally after the window is narrowed.
+        
         Args:
             canvas: The canvas to add controls to
         """
-        # Initialize variables for tracking mouse movement
-        prev_x = None
-        prev_y = None
+        pan_origin = None
+        pan_axes = (False, False)
         
-        # Pan start handler
+        # Pan start handler (panning shifts the view, items keep their coordinates)
         def move_start(event):
-            nonlocal prev_x, prev_y
-            prev_x = event.x
-            prev_y = event.y
-            canvas.config(cursor="fleur")
+            nonlocal pan_origin, pan_axes
+            pan_axes = (
+                canvas.svg_image.width() > canvas.winfo_width(),
+                canvas.svg_image.height() > canvas.winfo_height()
+            )
+            if not any(pan_axes):
+                pan_origin = None
+                return
+            
+            pan_origin = (event.x, event.y)
+            canvas.scan_mark(event.x, event.y)
+            canvas.config(cursor=_PAN_CURSORS[pan_axes])
         
-        # Pan movement handler
+        # Pan movement handler, fixed to the start position on axes that fit
         def move_move(event):
-            nonlocal prev_x, prev_y
-            if prev_x is not None and prev_y is not None:
-                dx = event.x - prev_x
-                dy = event.y - prev_y
-                prev_x = event.x
-                prev_y = event.y
-                canvas.move("all", dx, dy)
+            if pan_origin is None:
+                return
+            pan_x, pan_y = pan_axes
+            canvas.scan_dragto(
+                event.x if pan_x else pan_origin[0],
+                event.y if pan_y else pan_origin[1],
+                gain=1
+            )
         
         # Pan end handler
         def move_end(_event):
-            nonlocal prev_x, prev_y
-            prev_x = None
-            prev_y = None
             canvas.config(cursor="")
         
         # Bind pan controls
@@ -527,7 +912,7 @@ class TarkovMapApp:
         theme_label = ctk.CTkLabel(
             appearance_tab, 
             text="Theme:", 
-            font=ctk.CTkFont(weight="bold")
+            font=self._font_bold
         )
         theme_label.pack(anchor="w", pady=(10, 5))
         
@@ -564,13 +949,29 @@ class TarkovMapApp:
         )
         system_theme.pack(anchor="w", padx=20, pady=2)
         
-        # Maps tab
+        # Maps tab, filled in when it is first selected
         maps_tab = tab_view.add("Maps")
+        maps_tab_built = False
+        
+        def on_tab_change():
+            nonlocal maps_tab_built
+            if tab_view.get() == "Maps" and not maps_tab_built:
+                maps_tab_built = True
+                self._build_settings_maps_tab(maps_tab)
+        
+        tab_view.configure(command=on_tab_change)
+    
+    def _build_settings_maps_tab(self, maps_tab):
+        """
+        Create the contents of the settings dialog's Maps tab.
         
+        Args:
+            maps_tab: Tab frame to fill
+        """
         ctk.CTkLabel(
             maps_tab,
             text="Available Maps:",
-            font=ctk.CTkFont(weight="bold")
+            font=self._font_bold
         ).pack(anchor="w", pady=(10, 5))
         
         # Create a scrollable frame for maps list
@@ -578,7 +979,8 @@ class TarkovMapApp:
         maps_list_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         # Add available maps with checkboxes
-        for map_name in sorted(self.map_data.get_available_maps()):
+        self._ensure_map_lists()
+        for map_name in self._maps_sorted:
             map_row = ctk.CTkFrame(maps_list_frame)
             map_row.pack(fill="x", pady=2)
             
@@ -596,7 +998,7 @@ class TarkovMapApp:
                 map_row,
                 text="View",
                 width=60,
-                command=lambda m=map_name: self._show_map(m)
+                command=functools.partial(self._show_map, map_name)
             ).pack(side="right", padx=5)
     
     def _show_coord_history(self):
@@ -612,57 +1014,107 @@ class TarkovMapApp:
         history_window.geometry("500x400")
         history_window.resizable(True, True)
         
-        # Create a scrollable frame
-        scroll_frame = ctk.CTkScrollableFrame(history_window)
-        scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
         # Add headers
-        header_frame = ctk.CTkFrame(scroll_frame)
-        header_frame.pack(fill="x", pady=(0, 5))
+        header_frame = ctk.CTkFrame(history_window)
+        header_frame.pack(fill="x", padx=10, pady=(10, 0))
         
         ctk.CTkLabel(
             header_frame, 
             text="Coordinates", 
-            font=ctk.CTkFont(weight="bold")
+            font=self._font_bold
         ).pack(side="left", padx=5)
         
         ctk.CTkLabel(
             header_frame, 
             text="Timestamp", 
-            font=ctk.CTkFont(weight="bold")
+            font=self._font_bold
         ).pack(side="right", padx=5)
         
         # Add button to view coordinates on map
         ctk.CTkLabel(
             header_frame,
             text="Actions",
-            font=ctk.CTkFont(weight="bold")
+            font=self._font_bold
         ).pack(side="right", padx=25)
         
-        # Add history items
-        for i, (coords, timestamp) in enumerate(history):
-            item_frame = ctk.CTkFrame(scroll_frame)
-            item_frame.pack(fill="x", pady=2)
+        # Only rows that fit in the window get widgets; they are reused while scrolling
+        list_frame = ctk.CTkFrame(history_window, fg_color="transparent")
+        list_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        rows_frame = ctk.CTkFrame(list_frame, fg_color="transparent")
+        rows_frame.grid_propagate(False)
+        rows_frame.columnconfigure(0, weight=1)
+        
+        row_pady = 2  # Vertical padding around each row, before widget scaling
+        rows = []  # Pool of (frame, coordinates label, timestamp label, button)
+        offset = 0
+        
+        def add_row():
+            item_frame = ctk.CTkFrame(rows_frame)
+            coord_label = ctk.CTkLabel(item_frame, text="")
+            coord_label.pack(side="left", padx=5)
+            timestamp_label = ctk.CTkLabel(item_frame, text="")
+            timestamp_label.pack(side="right", padx=5)
+            view_button = ctk.CTkButton(item_frame, text="View on Map", width=100)
+            view_button.pack(side="right", padx=5)
+            rows.append((item_frame, coord_label, timestamp_label, view_button))
+        
+        # Measure a built row, since widget scaling changes its size in pixels
+        add_row()
+        rows[0][0].update_idletasks()
+        scaling = ctk.ScalingTracker.get_widget_scaling(rows_frame)
+        row_height = rows[0][0].winfo_reqheight() + 2 * round(row_pady * scaling)
+        
+        def visible_count():
+            return max(1, rows_frame.winfo_height() // row_height)
+        
+        def render():
+            count = min(visible_count(), len(history))
             
-            coord_text = f"X: {coords.x:.1f}, Y: {coords.y:.1f}, Z: {coords.z:.1f}"
-            ctk.CTkLabel(
-                item_frame, 
-                text=coord_text
-            ).pack(side="left", padx=5)
+            # Grow the row pool to fill the window
+            while len(rows) < count:
+                add_row()
             
-            ctk.CTkLabel(
-                item_frame, 
-                text=timestamp
-            ).pack(side="right", padx=5)
+            for i, (item_frame, coord_label, timestamp_label, view_button) in enumerate(rows):
+                if i >= count or offset + i >= len(history):
+                    item_frame.grid_remove()
+                    continue
+                
+                coords, timestamp = history[offset + i]
+                coord_label.configure(text=f"X: {coords.x:.1f}, Y: {coords.y:.1f}, Z: {coords.z:.1f}")
+                timestamp_label.configure(text=timestamp)
+                view_button.configure(command=functools.partial(self._show_coord_on_map, coords))
+                item_frame.grid(row=i, column=0, sticky="ew", pady=row_pady)
             
-            # Add button to view on map
-            maps_menu_button = ctk.CTkButton(
-                item_frame,
-                text="View on Map",
-                width=100,
-                command=lambda c=coords: self._show_coord_on_map(c)
-            )
-            maps_menu_button.pack(side="right", padx=5)
+            scrollbar.set(offset / len(history), min(1.0, (offset + count) / len(history)))
+        
+        def scroll_to(new_offset):
+            nonlocal offset
+            new_offset = max(0, min(new_offset, len(history) - visible_count()))
+            if new_offset != offset:
+                offset = new_offset
+                render()
+        
+        def on_scrollbar(action, amount, unit=None):
+            if action == "moveto":
+                scroll_to(round(float(amount) * len(history)))
+            elif action == "scroll":
+                step = int(amount)
+                if unit == "pages":
+                    step *= visible_count()
+                scroll_to(offset + step)
+        
+        def on_mousewheel(event):
+            scroll_to(offset + (-1 if event.num == 4 or event.delta > 0 else 1))
+        
+        scrollbar = ctk.CTkScrollbar(list_frame, command=on_scrollbar)
+        scrollbar.pack(side="right", fill="y")
+        rows_frame.pack(side="left", fill="both", expand=True)
+        
+        rows_frame.bind("<Configure>", lambda _event: render())
+        history_window.bind("<MouseWheel>", on_mousewheel)
+        history_window.bind("<Button-4>", on_mousewheel)
+        history_window.bind("<Button-5>", on_mousewheel)
     
     def _show_coord_on_map(self, coords):
         """
@@ -679,7 +1131,7 @@ class TarkovMapApp:
         ctk.CTkLabel(
             map_select,
             text="Select a map to view coordinates:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_heading
         ).pack(pady=10)
         
         # Create scrollable frame for maps
@@ -687,11 +1139,12 @@ class TarkovMapApp:
         maps_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Add buttons for each map
-        for map_name in sorted(self.map_data.get_available_maps()):
+        self._ensure_map_lists()
+        for map_name in self._maps_sorted:
             map_button = ctk.CTkButton(
                 maps_frame,
                 text=map_name,
-                command=lambda m=map_name: self._show_selected_map_with_coords(m, coords, map_select)
+                command=functools.partial(self._show_selected_map_with_coords, map_name, coords, map_select)
             )
             map_button.pack(fill="x", pady=5)
     
@@ -708,15 +1161,8 @@ class TarkovMapApp:
         if dialog:
             dialog.destroy()
         
-        # Temporarily override the latest coordinates
-        original_get_latest = self.screenshot_handler.get_latest_coordinates
-        self.screenshot_handler.get_latest_coordinates = lambda: coords
-        
         # Show the map
-        self._show_map(map_name)
-        
-        # Restore the original method
-        self.screenshot_handler.get_latest_coordinates = original_get_latest
+        self._show_map(map_name, coords_override=coords)
     
     def _open_wiki(self):
         """Open the official Escape from Tarkov wiki."""
@@ -734,7 +1180,7 @@ class TarkovMapApp:
         ctk.CTkLabel(
             about_window, 
             text="Tarkov Map Assistant",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self._font_large_title
         ).pack(pady=(20, 5))
         
         ctk.CTkLabel(
@@ -755,7 +1201,7 @@ class TarkovMapApp:
         ctk.CTkLabel(
             credits_frame, 
             text="Maps and data sourced from the tarkovdata project",
-            font=ctk.CTkFont(size=12)
+            font=self._font_body
         ).pack(pady=5)
         
         # GitHub link
@@ -774,5 +1220,21 @@ class TarkovMapApp:
         ).pack(pady=15)
     
     def _set_status(self, message):
-        """Update the status bar with a message."""
-        self.status_bar.configure(text=message)
\ No newline at end of file
+        """
+        Update the status bar with a message.
+        
+        Updates are applied when Tk is idle, so a burst of messages only
+        redraws the status bar once with the latest one.
+        
+        Args:
+            message: Message to show
+        """
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest pending status message."""
+        self._status_scheduled = False
+        self.status_bar.configure(text=self._pending_status)
\ No newline at end of file
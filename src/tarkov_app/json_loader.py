@@ -0,0 +1,12 @@
+"""
+JSON parsing for the Tarkov Map Assistant.
+
+orjson is used when it is installed, as a faster drop-in for json.loads.
+"""
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+__all__ = ["loads"]
@@ -5,13 +5,162 @@ This module initializes the application and starts the GUI.
 """
 import os
 import sys
+import stat
 import logging
 import logging.handlers
+import functools
+import threading
 from pathlib import Path
 
-from .gui import TarkovMapApp
-from .screenshot_handler import ScreenshotHandler
-from .data_manager import TarkovDataManager, MapDataManager
+# Extra bytes a text mode file writes for each newline (1 on Windows)
+_NEWLINE_EXTRA = len(os.linesep) - 1
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler tuned for frequent, small log records.
+    
+    The standard handler stats the log file and flushes it for every record.
+    This one keeps its own estimate of the file size, so the file system is
+    only consulted when a rollover is due. Records are written through a
+    larger buffer that is flushed for warnings and errors, periodically from
+    a background thread, and when logging shuts down at exit.
+    """
+    
+    _size = 0  # Estimated size of the current log file in bytes
+    _stream_encoding = "utf-8"  # Encoding of the open log file
+    _stream_errors = "strict"  # Encoding error handler of the open log file
+    
+    def __init__(self, *args, buffer_size=65536, flush_interval=30.0, **kwargs):
+        """
+        Initialize the handler.
+        
+        Args:
+            *args: Positional arguments for RotatingFileHandler
+            buffer_size: Size of the write buffer in bytes
+            flush_interval: Seconds between background flushes, or 0 to disable them
+            **kwargs: Keyword arguments for RotatingFileHandler
+        """
+        self.buffer_size = buffer_size
+        super().__init__(*args, **kwargs)
+        
+        self._stop_flushing = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name="log-flush",
+                daemon=True
+            ).start()
+    
+    def _open(self):
+        """Open the log file with a larger write buffer."""
+        stream = open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=getattr(self, "errors", None)
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        self._stream_encoding = stream.encoding
+        self._stream_errors = stream.errors
+        return stream
+    
+    def _encoded_size(self, msg):
+        """
+        Get the number of bytes a formatted record takes up in the log file.
+        
+        Args:
+            msg: The formatted record, including the terminator
+            
+        Returns:
+            Size of the record in bytes once encoded and newline-translated
+        """
+        if msg.isascii():
+            size = len(msg)
+        else:
+            size = len(msg.encode(self._stream_encoding, self._stream_errors))
+        if _NEWLINE_EXTRA:
+            size += msg.count("\n") * _NEWLINE_EXTRA
+        return size
+    
+    def shouldRollover(self, record):
+        """
+        Determine if rollover should occur.
+        
+        Args:
+            record: Log record about to be written
+            
+        Returns:
+            True if the log file should be rotated before writing the record
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        msg = self.format(record) + self.terminator
+        return self._should_rollover(self._encoded_size(msg))
+    
+    def _should_rollover(self, size):
+        """
+        Determine if rollover should occur, given the size of the formatted record.
+        
+        Args:
+            size: Size of the formatted record in bytes
+            
+        Returns:
+            True if the log file should be rotated before writing the record
+        """
+        if self.maxBytes <= 0:
+            return False
+        
+        if self._size + size < self.maxBytes:
+            return False
+        
+        # Confirm against the file itself; the stdlib check counts characters, not bytes
+        self.stream.flush()
+        file_stat = os.fstat(self.stream.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            return False
+        self._size = file_stat.st_size
+        return self._size + size >= self.maxBytes
+    
+    def emit(self, record):
+        """
+        Write a record, flushing only for warnings and errors.
+        
+        Args:
+            record: Log record to write
+        """
+        try:
+            # Format and measure once for both the size check and the write
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            size = self._encoded_size(msg)
+            if self._should_rollover(size):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        """Stop the background flushes and close the log file."""
+        self._stop_flushing.set()
+        super().close()
+    
+    def _flush_periodically(self, interval):
+        """
+        Flush buffered records until the handler is closed.
+        
+        Args:
+            interval: Seconds between flushes
+        """
+        while not self._stop_flushing.wait(interval):
+            self.flush()
 
 def setup_logging():
     """Configure application logging."""
@@ -27,7 +176,7 @@ def setup_logging():
     logger.setLevel(logging.INFO)
     
     # File handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = FastRotatingFileHandler(
         log_file, maxBytes=1048576, backupCount=5
     )
     file_format = logging.Formatter(
@@ -52,48 +201,58 @@ def get_application_paths():
     """
     Get paths for application resources.
     
+    Returns:
+        Dictionary containing paths for various application resources
+    """
+    # Paths do not change while the application runs, so they are resolved once
+    return dict(_resolve_application_paths())
+
+@functools.lru_cache(maxsize=None)
+def _resolve_application_paths():
+    """
+    Resolve paths for application resources.
+    
     Returns:
         Dictionary containing paths for various application resources
     """
     # Determine the base path for the application
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    app_dir = os.path.join(base_dir, "tarkov_app")
+    base_dir = Path(os.path.abspath(__file__)).parent.parent
+    app_dir = base_dir / "tarkov_app"
     
     # Check if we're running from a bundled application
     if getattr(sys, 'frozen', False):
         # Running in a bundle
-        base_dir = os.path.dirname(sys.executable)
+        base_dir = Path(sys.executable).parent
         app_dir = base_dir
     
     # Set up paths
-    config_path = os.path.join(os.path.dirname(base_dir), "config", "map_config.json")
-    maps_dir = os.path.join(app_dir, "maps")
-    icons_dir = os.path.join(app_dir, "icons")
+    project_dir = base_dir.parent
+    user_dir = Path.home() / ".tarkov_assistant"
     
     # Create user data directory
-    user_data_dir = os.path.join(Path.home(), ".tarkov_assistant", "data")
-    os.makedirs(user_data_dir, exist_ok=True)
+    user_data_dir = user_dir / "data"
+    if not user_data_dir.is_dir():
+        user_data_dir.mkdir(parents=True, exist_ok=True)
     
-    # Path for coordinates file
-    coords_file = os.path.join(user_data_dir, "coordinates.txt")
-    
-    # Create result paths
+    # Create result paths; the cache directory is created on first use
     paths = {
-        "config_path": config_path,
-        "maps_dir": maps_dir,
-        "icons_dir": icons_dir,
-        "coords_file": coords_file,
+        "config_path": str(project_dir / "config" / "map_config.json"),
+        "maps_dir": str(app_dir / "maps"),
+        "icons_dir": str(app_dir / "icons"),
+        "coords_file": str(user_data_dir / "coordinates.txt"),
+        "cache_dir": str(user_dir / "cache"),
     }
     
     # Check for tarkovdata (optional)
     # Try multiple potential locations
     tarkov_data_locations = [
-        os.path.join(os.path.dirname(base_dir), "data", "tarkovdata"),  # Standard location
-        os.path.join(os.path.dirname(base_dir), "tarkovdata-master"),   # Direct repo location
-        os.path.join(base_dir, "data", "tarkovdata"),                  # Alternate location
+        project_dir / "data" / "tarkovdata",  # Standard location
+        project_dir / "tarkovdata-master",    # Direct repo location
+        base_dir / "data" / "tarkovdata",     # Alternate location
     ]
     
     for location in tarkov_data_locations:
+        location = str(location)
         if os.path.exists(location):
             paths["tarkov_data_dir"] = location
             break
@@ -102,6 +261,11 @@ def get_application_paths():
 
 def main():
     """Main entry point for the application."""
+    # Imported here so importing this module does not load Tk and the data managers
+    from .gui import TarkovMapApp
+    from .screenshot_handler import ScreenshotHandler
+    from .data_manager import TarkovDataManager, MapDataManager
+    
     # Set up logging
     logger = setup_logging()
     logger.info("Application starting")
@@ -114,9 +278,9 @@ def main():
         
         # Set up tarkov data manager if available
         tarkov_data = None
-        if 'tarkov_data_dir' in paths and os.path.exists(paths['tarkov_data_dir']):
+        if 'tarkov_data_dir' in paths:
             logger.info(f"Using tarkov data directory: {paths['tarkov_data_dir']}")
-            tarkov_data = TarkovDataManager(paths["tarkov_data_dir"])
+            tarkov_data = TarkovDataManager(paths["tarkov_data_dir"], cache_dir=paths["cache_dir"])
         else:
             logger.warning("Tarkov data directory not found. Extended game information will not be available.")
         
@@ -136,7 +300,8 @@ def main():
         app = TarkovMapApp(
             screenshot_handler=screenshot_handler,
             map_data=map_data,
-            icons_dir=paths["icons_dir"]
+            icons_dir=paths["icons_dir"],
+            cache_dir=paths["cache_dir"]
         )
         
         logger.info("Starting GUI")
@@ -5,16 +5,19 @@ This module handles loading, displaying and interaction with game maps.
 """
 import os
 import logging
-from typing import Dict, Tuple, Optional
+import functools
+from array import array
+from typing import Dict, Tuple, Optional, Sequence
 from dataclasses import dataclass
 
+from .compat import DATACLASS_OPTIONS
 from .config_manager import ConfigManager
 from .screenshot_handler import Coordinates
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MapPoint:
     """Data class for a point on a map."""
     x: int
@@ -29,12 +32,8 @@ class MapPoint:
         Returns:
             Tuple of (x1, y1, x2, y2) coordinates for oval drawing
         """
-        return (
-            self.x - self.radius,
-            self.y - self.radius,
-            self.x + self.radius,
-            self.y + self.radius
-        )
+        x, y, radius = self.x, self.y, self.radius
+        return (x - radius, y - radius, x + radius, y + radius)
 
 class MapManager:
     """Manages game maps and coordinate mapping."""
@@ -49,7 +48,16 @@ class MapManager:
         """
         self.config_manager = config_manager
         self.maps_dir = maps_dir
+        self._map_set = frozenset()  # SVG file names found in maps_dir
         self.available_maps = self._find_available_maps()
+        
+        # Map transforms by (map name, canvas width, canvas height), cached per
+        # instance rather than on the class so entries are freed with the manager
+        self._get_transform = functools.lru_cache(maxsize=32)(self._compute_transform)
+    
+    def clear_cache(self) -> None:
+        """Forget cached map transforms, e.g. after the map configuration is reloaded."""
+        self._get_transform.cache_clear()
     
     def _find_available_maps(self) -> list:
         """
@@ -59,11 +67,11 @@ class MapManager:
             List of available map names
         """
         try:
-            maps = []
-            for file in os.listdir(self.maps_dir):
-                if file.endswith(".svg"):
-                    map_name = os.path.splitext(file)[0]
-                    maps.append(map_name)
+            with os.scandir(self.maps_dir) as entries:
+                map_files = [entry.name for entry in entries if entry.name.endswith(".svg") and entry.is_file()]
+            
+            self._map_set = frozenset(map_files)
+            maps = [file[:-4] for file in map_files]
             
             if not maps:
                 logger.warning(f"No SVG maps found in {self.maps_dir}")
@@ -87,12 +95,12 @@ class MapManager:
             ValueError: If the map does not exist
         """
         map_file = f"{map_name}.svg"
-        map_path = os.path.join(self.maps_dir, map_file)
         
-        if not os.path.exists(map_path):
+        # Check against the files found at startup instead of the file system
+        if map_file not in self._map_set:
             raise ValueError(f"Map not found: {map_name}")
         
-        return map_path
+        return os.path.join(self.maps_dir, map_file)
     
     def game_to_map_coordinates(self, map_name: str, game_coords: Coordinates, canvas_width: int, canvas_height: int) -> MapPoint:
         """
@@ -107,6 +115,77 @@ class MapManager:
         Returns:
             MapPoint with converted coordinates
         """
+        # Convert coordinates
+        real_x, real_y = self._apply_transform(
+            self._get_transform(map_name, canvas_width, canvas_height),
+            game_coords.x, game_coords.z
+        )
+        
+        logger.debug(f"Converted game coords {game_coords} to map point ({int(real_x)}, {int(real_y)})")
+        
+        return MapPoint(x=int(real_x), y=int(real_y))
+    
+    def game_to_map_coordinates_batch(self, map_name: str, xs: Sequence[float], zs: Sequence[float],
+                                      canvas_width: int, canvas_height: int) -> Tuple[array, array]:
+        """
+        Convert many game coordinates to map coordinates at once.
+        
+        The map transform is looked up once for the whole batch, so this suits
+        drawing a full coordinate history, e.g. the columns returned by
+        ScreenshotHandler.get_all_coordinates_arrays.
+        
+        Args:
+            map_name: Name of the map
+            xs: Game X coordinates
+            zs: Game Z coordinates, in the same order as xs
+            canvas_width: Width of the canvas
+            canvas_height: Height of the canvas
+            
+        Returns:
+            Tuple of (x values, y values) arrays of whole map pixels
+            
+        Raises:
+            OverflowError: If a point lies beyond the range of a C int
+        """
+        transform = self._get_transform(map_name, canvas_width, canvas_height)
+        apply_transform = self._apply_transform
+        points = [apply_transform(transform, x, z) for x, z in zip(xs, zs)]
+        
+        return (
+            array('i', [int(real_x) for real_x, _ in points]),
+            array('i', [int(real_y) for _, real_y in points])
+        )
+    
+    @staticmethod
+    def _apply_transform(transform: Tuple[float, ...], x: float, z: float) -> Tuple[float, float]:
+        """
+        Convert one game position to map coordinates with a precomputed transform.
+        
+        Args:
+            transform: Transform constants from _compute_transform
+            x: Game X coordinate
+            z: Game Z coordinate
+            
+        Returns:
+            Tuple of (x, y) map coordinates
+        """
+        half_width, half_height, center_x, center_y, scale_x, scale_y = transform
+        return half_width - (x - center_x) * scale_x, half_height + (z - center_y) * scale_y
+    
+    def _compute_transform(self, map_name: str, canvas_width: int, canvas_height: int) -> Tuple[float, ...]:
+        """
+        Compute the constants for converting game coordinates to map coordinates.
+        
+        Called through the cached _get_transform.
+        
+        Args:
+            map_name: Name of the map
+            canvas_width: Width of the canvas
+            canvas_height: Height of the canvas
+            
+        Returns:
+            Tuple of (half_width, half_height, center_x, center_y, scale_x, scale_y)
+        """
         map_config = self.config_manager.get_map_config(map_name)
         
         # Calculate map center point
@@ -117,10 +196,4 @@ class MapManager:
         scale_x = canvas_width / (map_config["pointMaxX"] - map_config["pointMinX"])
         scale_y = canvas_height / (map_config["pointMaxY"] - map_config["pointMinY"])
         
-        # Convert coordinates
-        real_x = canvas_width / 2 - ((game_coords.x - center_x) * scale_x)
-        real_y = canvas_height / 2 + ((game_coords.z - center_y) * scale_y)
-        
-        logger.debug(f"Converted game coords {game_coords} to map point ({int(real_x)}, {int(real_y)})")
-        
-        return MapPoint(x=int(real_x), y=int(real_y))
\ No newline at end of file
+        return canvas_width / 2, canvas_height / 2, center_x, center_y, scale_x, scale_y
\ No newline at end of file
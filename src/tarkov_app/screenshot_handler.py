@@ -6,14 +6,46 @@ and manage screenshot data.
 """
 import os
 import re
+import time
+import atexit
 import logging
-from typing import Tuple, Optional, List
+import functools
+from array import array
+from typing import Tuple, Optional, List, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+
+from .compat import DATACLASS_OPTIONS
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Coordinates pattern in screenshot filenames, e.g. "..._134.6, -5.5, 2.8_..."
+_COORD_RE = re.compile(r"_(-?\d+\.\d+), (-?\d+\.\d+), (-?\d+\.\d+)_")
+
+@functools.lru_cache(maxsize=1024)
+def _parse_filename_coordinates(filename: str) -> Optional[Tuple[float, float, float]]:
+    """
+    Parse the coordinates embedded in a screenshot filename.
+    
+    Results are cached, as the same filenames tend to be seen repeatedly.
+    
+    Args:
+        filename: Screenshot filename
+        
+    Returns:
+        Tuple of (x, y, z), or None if the filename has no coordinates
+    """
+    match = _COORD_RE.search(filename)
+    if match:
+        return tuple(map(float, match.groups()))
+    return None
+
+# Format of the timestamps saved with coordinates
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Bytes read from the end of the coordinates file when looking for the latest entry
+_TAIL_READ_SIZE = 4096
+
+@dataclass(**DATACLASS_OPTIONS)
 class Coordinates:
     """Data class to store extracted coordinates."""
     x: float
@@ -34,6 +66,8 @@ class ScreenshotHandler:
             coord_file_path: Path to the file storing coordinates
         """
         self.coord_file_path = coord_file_path
+        self._index_path = f"{coord_file_path}.idx"  # Location of the last saved entries
+        self._file = None  # Append handle, opened on the first save
         self._ensure_file_exists()
     
     def _ensure_file_exists(self) -> None:
@@ -41,9 +75,15 @@ class ScreenshotHandler:
         if not os.path.exists(self.coord_file_path):
             try:
                 # Create file and parent directories if they don't exist
-                os.makedirs(os.path.dirname(self.coord_file_path), exist_ok=True)
+                parent = os.path.dirname(self.coord_file_path)
+                if parent:
+                    os.makedirs(parent, exist_ok=True)
                 with open(self.coord_file_path, 'w') as f:
                     f.write("# Tarkov coordinates file - Format: X, Y, Z, Timestamp\n")
+                
+                # An index left over from a previous file would point at the wrong data
+                if os.path.exists(self._index_path):
+                    os.remove(self._index_path)
                 logger.info(f"Created coordinates file: {self.coord_file_path}")
             except Exception as e:
                 logger.error(f"Failed to create coordinates file: {e}")
@@ -61,15 +101,11 @@ class ScreenshotHandler:
         Raises:
             ValueError: If coordinates cannot be extracted from the filename
         """
-        # Regular expression to match coordinates pattern in filenames
-        pattern = r"_(-?\d+\.\d+), (-?\d+\.\d+), (-?\d+\.\d+)_"
-        match = re.search(pattern, filename)
+        values = _parse_filename_coordinates(filename)
         
-        if match:
-            x = float(match.group(1))
-            y = float(match.group(2))
-            z = float(match.group(3))
-            return Coordinates(x, y, z)
+        # Coordinates are mutable, so a new object is returned for every call
+        if values:
+            return Coordinates(*values)
         else:
             raise ValueError(f"Could not extract coordinates from filename: {filename}")
     
@@ -81,13 +117,122 @@ class ScreenshotHandler:
             coords: Coordinates object to save
         """
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(self.coord_file_path, 'a') as file:
-                file.write(f"{coords.x}, {coords.y}, {coords.z}, {timestamp}\n")
+            timestamp = time.strftime(_TIMESTAMP_FORMAT)
+            self._append(f"{coords.x}, {coords.y}, {coords.z}, {timestamp}\n")
             logger.info(f"Saved coordinates: {coords}")
         except Exception as e:
             logger.error(f"Failed to save coordinates: {e}")
     
+    def save_coordinates_many(self, coords_list: Iterable[Coordinates]) -> None:
+        """
+        Save several coordinates to the coordinates file in a single write.
+        
+        The timestamp is formatted once and shared by all entries.
+        
+        Args:
+            coords_list: Coordinates objects to save
+        """
+        try:
+            timestamp = time.strftime(_TIMESTAMP_FORMAT)
+            lines = [f"{coords.x}, {coords.y}, {coords.z}, {timestamp}\n" for coords in coords_list]
+            if not lines:
+                return
+            
+            self._append("".join(lines))
+            logger.info(f"Saved {len(lines)} coordinates")
+        except Exception as e:
+            logger.error(f"Failed to save coordinates: {e}")
+    
+    def _append(self, data: str) -> None:
+        """
+        Append entries to the coordinates file and index their location.
+        
+        The index file holds the byte range of the last write, so the latest
+        entry can be read without scanning the coordinates file.
+        
+        Args:
+            data: Complete lines to append
+        """
+        file = self._get_append_file()
+        start = self._get_file_size(file)
+        file.write(data)
+        file.flush()
+        
+        end = self._get_file_size(file)
+        if start is None or end is None:
+            return
+        try:
+            # Written with os.write to keep this off the buffered file machinery
+            fd = os.open(self._index_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, f"{start} {end}".encode('ascii'))
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"Could not update coordinates index: {e}")
+    
+    @staticmethod
+    def _get_file_size(file) -> Optional[int]:
+        """
+        Get the size of an open file.
+        
+        Args:
+            file: Open file object
+            
+        Returns:
+            Size of the file in bytes, or None if it cannot be determined
+        """
+        try:
+            return os.fstat(file.fileno()).st_size
+        except (OSError, TypeError, ValueError):
+            return None
+    
+    def _get_append_file(self):
+        """
+        Get the handle used for appending to the coordinates file.
+        
+        The file is opened once and kept open, rather than reopened for
+        every save. It is reopened if the file was deleted or replaced since,
+        and closed by close() or when the interpreter exits.
+        
+        Returns:
+            File object opened for appending
+        """
+        if self._file is not None and not self._is_open_file_current():
+            # Writing on would go to an orphaned file nobody reads
+            logger.info(f"Reopening replaced coordinates file: {self.coord_file_path}")
+            self.close()
+            self._ensure_file_exists()
+        
+        if self._file is None:
+            self._file = open(self.coord_file_path, 'a')
+            atexit.register(self.close)
+        return self._file
+    
+    def _is_open_file_current(self) -> bool:
+        """
+        Check whether the open handle still refers to the coordinates file.
+        
+        Returns:
+            True if the path exists and is the same file as the open handle
+        """
+        try:
+            open_stat = os.fstat(self._file.fileno())
+            path_stat = os.stat(self.coord_file_path)
+        except (OSError, TypeError, ValueError):
+            return False
+        return (open_stat.st_ino, open_stat.st_dev) == (path_stat.st_ino, path_stat.st_dev)
+    
+    def close(self) -> None:
+        """Close the coordinates file if it is open."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception as e:
+                logger.error(f"Failed to close coordinates file: {e}")
+            self._file = None
+            atexit.unregister(self.close)
+    
     def get_latest_coordinates(self) -> Optional[Coordinates]:
         """
         Get the most recently saved coordinates.
@@ -96,47 +241,130 @@ class ScreenshotHandler:
             The latest coordinates or None if no coordinates are available
         """
         try:
-            with open(self.coord_file_path, 'r') as file:
-                lines = file.readlines()
+            last_line = self._read_last_data_line()
+            if last_line is None:
+                logger.warning("No coordinates found in file")
+                return None
+            
+            parts = last_line.rstrip().split(', ', 3)
+            
+            # Handle different formats
+            if len(parts) >= 3:
+                # Full x, y, z format
+                return Coordinates(
+                    x=float(parts[0]),
+                    y=float(parts[1]),
+                    z=float(parts[2])
+                )
+            elif len(parts) == 2:
+                # Old x, z format (where y is missing)
+                return Coordinates(
+                    x=float(parts[0]),
+                    y=0.0,  # Default Y value (height)
+                    z=float(parts[1])
+                )
+            else:
+                logger.error(f"Invalid format in coordinates file: {last_line}")
+                return None
                 
-                # Filter out comment lines and empty lines
-                data_lines = [line for line in lines if line.strip() and not line.startswith('#')]
+        except Exception as e:
+            logger.error(f"Error reading coordinates: {e}")
+            return None
+    
+    def _read_last_data_line(self) -> Optional[str]:
+        """
+        Read the last line of the coordinates file that is not a comment or blank.
+        
+        The index file written on save is used when it matches the file's
+        current size. Otherwise only the end of the file is read, doubling the
+        window until a data line is found or the start of the file is reached.
+        
+        Returns:
+            The last data line, or None if the file has no data lines
+        """
+        index = self._read_index()
+        with open(self.coord_file_path, 'rb') as file:
+            file.seek(0, os.SEEK_END)
+            size = file.tell()
+            
+            # Use the indexed range unless the file was changed elsewhere
+            if index and index[1] == size and 0 <= index[0] < size:
+                file.seek(index[0])
+                for line in reversed(file.read(size - index[0]).split(b'\n')):
+                    if line.strip() and not line.startswith(b'#'):
+                        return line.decode('utf-8')
+            
+            window = _TAIL_READ_SIZE
+            
+            while True:
+                start = max(0, size - window)
+                file.seek(start)
+                lines = file.read(size - start).split(b'\n')
                 
-                if not data_lines:
-                    logger.warning("No coordinates found in file")
-                    return None
+                # The first line may be cut off unless the window reached the start
+                if start > 0:
+                    lines = lines[1:]
                 
-                # Get the last line with coordinates
-                last_line = data_lines[-1]
-                parts = last_line.strip().split(', ')
+                for line in reversed(lines):
+                    if line.strip() and not line.startswith(b'#'):
+                        return line.decode('utf-8')
                 
-                # Handle different formats
-                if len(parts) >= 3:
-                    # Full x, y, z format
-                    return Coordinates(
-                        x=float(parts[0]),
-                        y=float(parts[1]),
-                        z=float(parts[2])
-                    )
-                elif len(parts) == 2:
-                    # Old x, z format (where y is missing)
-                    return Coordinates(
-                        x=float(parts[0]),
-                        y=0.0,  # Default Y value (height)
-                        z=float(parts[1])
-                    )
-                else:
-                    logger.error(f"Invalid format in coordinates file: {last_line}")
+                if start == 0:
                     return None
-                    
-        except Exception as e:
-            logger.error(f"Error reading coordinates: {e}")
+                window *= 2
+    
+    def _read_index(self) -> Optional[Tuple[int, int]]:
+        """
+        Read the byte range of the last saved entries from the index file.
+        
+        Returns:
+            Tuple of (start, end) offsets, or None if there is no usable index
+        """
+        try:
+            with open(self._index_path, 'rb') as file:
+                start, end = map(int, file.read().split())
+            return start, end
+        except (OSError, ValueError):
             return None
     
+    @staticmethod
+    def _parse_line(line: str) -> Optional[Tuple[float, float, float, str]]:
+        """
+        Parse one line of the coordinates file.
+        
+        Args:
+            line: Line read from the coordinates file
+            
+        Returns:
+            Tuple of (x, y, z, timestamp), or None for comments, blank lines
+            and lines matching no known format
+            
+        Raises:
+            ValueError: If a coordinate value is not a number
+        """
+        if line.startswith('#'):
+            return None
+        # Blank lines give a single empty part and match no format
+        parts = line.rstrip().split(', ', 3)
+        
+        # Handle different formats
+        if len(parts) >= 4:
+            # Full x, y, z, timestamp format
+            return float(parts[0]), float(parts[1]), float(parts[2]), parts[3]
+        elif len(parts) == 3:
+            # x, y, z format without timestamp
+            return float(parts[0]), float(parts[1]), float(parts[2]), "Imported data"
+        elif len(parts) == 2:
+            # Old x, z format without timestamp
+            return float(parts[0]), 0.0, float(parts[1]), "Imported data"
+        return None
+    
     def get_all_coordinates(self) -> List[Tuple[Coordinates, str]]:
         """
         Get all saved coordinates with timestamps.
         
+        Reading stops at the first line with a value that is not a number.
+        
         Returns:
             List of tuples containing coordinates and timestamps
         """
@@ -144,39 +372,38 @@ class ScreenshotHandler:
         try:
             with open(self.coord_file_path, 'r') as file:
                 for line in file:
-                    if line.strip() and not line.startswith('#'):
-                        parts = line.strip().split(', ')
-                        
-                        # Handle different formats
-                        if len(parts) >= 4:
-                            # Full x, y, z, timestamp format
-                            coords = Coordinates(
-                                x=float(parts[0]),
-                                y=float(parts[1]),
-                                z=float(parts[2])
-                            )
-                            timestamp = parts[3]
-                            result.append((coords, timestamp))
-                        elif len(parts) == 2:
-                            # Old x, z format with generated timestamp
-                            coords = Coordinates(
-                                x=float(parts[0]),
-                                y=0.0,  # Default Y value
-                                z=float(parts[1])
-                            )
-                            # Use current date as timestamp since original doesn't have one
-                            timestamp = "Imported data"
-                            result.append((coords, timestamp))
-                        elif len(parts) == 3:
-                            # x, y, z format without timestamp
-                            coords = Coordinates(
-                                x=float(parts[0]),
-                                y=float(parts[1]),
-                                z=float(parts[2])
-                            )
-                            timestamp = "Imported data"
-                            result.append((coords, timestamp))
+                    entry = self._parse_line(line)
+                    if entry is not None:
+                        x, y, z, timestamp = entry
+                        result.append((Coordinates(x=x, y=y, z=z), timestamp))
+        except Exception as e:
+            logger.error(f"Error reading all coordinates: {e}")
+        
+        return result
+    
+    def get_all_coordinates_arrays(self) -> Tuple[array, array, array, List[str]]:
+        """
+        Get all saved coordinates as columns rather than one object per entry.
+        
+        Reads the file the same way as get_all_coordinates, but stores each
+        axis in a compact array of doubles, which suits long histories and
+        batch conversion to map positions.
+        
+        Returns:
+            Tuple of (x values, y values, z values, timestamps)
+        """
+        xs, ys, zs = array('d'), array('d'), array('d')
+        timestamps = []
+        try:
+            with open(self.coord_file_path, 'r') as file:
+                for line in file:
+                    entry = self._parse_line(line)
+                    if entry is not None:
+                        xs.append(entry[0])
+                        ys.append(entry[1])
+                        zs.append(entry[2])
+                        timestamps.append(entry[3])
         except Exception as e:
             logger.error(f"Error reading all coordinates: {e}")
         
-        return result
\ No newline at end of file
+        return xs, ys, zs, timestamps
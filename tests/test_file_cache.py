@@ -0,0 +1,92 @@
+"""
+Unit tests for the file cache module.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from tarkov_app.file_cache import get_cache_path, write_cache_file
+
+
+def write_text(text):
+    """Create a cache writer that writes the given text."""
+    def write(path):
+        with open(path, 'w') as f:
+            f.write(text)
+    return write
+
+
+class TestFileCache(unittest.TestCase):
+    """Test cases for the file cache helpers."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.source_path = os.path.join(self.temp_dir, "map.svg")
+        with open(self.source_path, 'w') as f:
+            f.write("<svg/>")
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_get_cache_path_missing_source(self):
+        """Test that a missing source file gives no cache path."""
+        missing_path = os.path.join(self.temp_dir, "missing.svg")
+        self.assertIsNone(get_cache_path(self.cache_dir, missing_path, ".png"))
+    
+    def test_write_cache_file(self):
+        """Test writing a cache file."""
+        cache_path = get_cache_path(self.cache_dir, self.source_path, ".png")
+        self.assertTrue(write_cache_file(cache_path, write_text("rendered")))
+        
+        with open(cache_path) as f:
+            self.assertEqual(f.read(), "rendered")
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(cache_path)])
+    
+    def test_write_cache_file_error(self):
+        """Test that a failing writer leaves no files behind."""
+        def write(path):
+            with open(path, 'w') as f:
+                f.write("partial")
+            raise ValueError("render failed")
+        
+        cache_path = get_cache_path(self.cache_dir, self.source_path, ".png")
+        self.assertFalse(write_cache_file(cache_path, write))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+    
+    def test_write_cache_file_removes_old_versions(self):
+        """Test that caches of older source versions are removed on write."""
+        old_paths = [
+            get_cache_path(self.cache_dir, self.source_path, suffix)
+            for suffix in (".w800.png", ".w1000.png")
+        ]
+        for path in old_paths:
+            write_cache_file(path, write_text("old"))
+        
+        # Edit the source, which changes its version
+        with open(self.source_path, 'w') as f:
+            f.write("<svg width='10'/>")
+        other_source = os.path.join(self.temp_dir, "other.svg")
+        with open(other_source, 'w') as f:
+            f.write("<svg/>")
+        other_path = get_cache_path(self.cache_dir, other_source, ".w800.png")
+        write_cache_file(other_path, write_text("other"))
+        
+        new_paths = [
+            get_cache_path(self.cache_dir, self.source_path, suffix)
+            for suffix in (".w800.png", ".w1200.png")
+        ]
+        for path in new_paths:
+            write_cache_file(path, write_text("new"))
+        
+        self.assertEqual(
+            sorted(os.listdir(self.cache_dir)),
+            sorted(os.path.basename(path) for path in new_paths + [other_path])
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the main module.
+"""
+import os
+import glob
+import shutil
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tarkov_app import main
+from tarkov_app.main import FastRotatingFileHandler
+
+
+class TestFastRotatingFileHandler(unittest.TestCase):
+    """Test cases for the FastRotatingFileHandler class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, "test.log")
+        self.handler = FastRotatingFileHandler(
+            self.log_file, maxBytes=2000, backupCount=5,
+            encoding="utf-8", flush_interval=0
+        )
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        
+        self.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.handler)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_rollover_with_non_ascii_records(self):
+        """Test that log files stay within maxBytes when records are not ASCII."""
+        for i in range(60):
+            self.logger.info(f"Карта загружена: Развязка {i}")
+        self.handler.close()
+        
+        log_files = glob.glob(self.log_file + "*")
+        self.assertGreater(len(log_files), 1)
+        for path in log_files:
+            self.assertLessEqual(os.path.getsize(path), 2000)
+
+
+
+class TestGetApplicationPaths(unittest.TestCase):
+    """Test cases for get_application_paths."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        home_patcher = patch.object(Path, "home", return_value=Path(self.temp_dir))
+        home_patcher.start()
+        self.addCleanup(home_patcher.stop)
+        main._resolve_application_paths.cache_clear()
+        self.addCleanup(main._resolve_application_paths.cache_clear)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_get_application_paths(self):
+        """Test the resolved user paths."""
+        paths = main.get_application_paths()
+        user_dir = os.path.join(self.temp_dir, ".tarkov_assistant")
+        
+        self.assertEqual(paths["cache_dir"], os.path.join(user_dir, "cache"))
+        self.assertEqual(paths["coords_file"], os.path.join(user_dir, "data", "coordinates.txt"))
+        self.assertTrue(os.path.isdir(os.path.join(user_dir, "data")))
+    
+    def test_get_application_paths_returns_copy(self):
+        """Test that changing the returned paths does not affect later calls."""
+        paths = main.get_application_paths()
+        paths["cache_dir"] = "elsewhere"
+        paths["extra"] = "value"
+        
+        new_paths = main.get_application_paths()
+        self.assertIsNot(new_paths, paths)
+        self.assertNotEqual(new_paths["cache_dir"], "elsewhere")
+        self.assertNotIn("extra", new_paths)
+
+
+if __name__ == '__main__':
+    unittest.main()
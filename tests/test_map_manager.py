@@ -0,0 +1,53 @@
+"""
+Unit tests for the map manager module.
+"""
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from tarkov_app.config_manager import ConfigManager
+from tarkov_app.map_manager import MapManager
+from tarkov_app.screenshot_handler import Coordinates
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "map_config.json")
+
+
+class TestMapManager(unittest.TestCase):
+    """Test cases for the MapManager class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.maps_dir = tempfile.mkdtemp()
+        self.map_manager = MapManager(ConfigManager(CONFIG_PATH), self.maps_dir)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.maps_dir)
+    
+    def test_game_to_map_coordinates_batch_matches_scalar(self):
+        """Test that batch conversion gives the same points as converting one at a time."""
+        rng = random.Random(0)
+        coords_list = [
+            Coordinates(x=rng.uniform(-400, 700), y=0.0, z=rng.uniform(-350, 250))
+            for _ in range(1000)
+        ]
+        
+        for map_name in ("Customs", "Woods", "Unknown"):
+            xs, ys = self.map_manager.game_to_map_coordinates_batch(
+                map_name,
+                [coords.x for coords in coords_list],
+                [coords.z for coords in coords_list],
+                1000, 700
+            )
+            expected = [
+                self.map_manager.game_to_map_coordinates(map_name, coords, 1000, 700)
+                for coords in coords_list
+            ]
+            self.assertEqual(list(xs), [point.x for point in expected])
+            self.assertEqual(list(ys), [point.y for point in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,8 +21,10 @@ class TestScreenshotHandler(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        self.handler.close()
+        for path in (self.temp_file.name, self.temp_file.name + ".idx"):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_extract_coordinates_valid(self):
         """Test extracting coordinates from a valid filename."""
@@ -54,6 +56,40 @@ class TestScreenshotHandler(unittest.TestCase):
             self.assertIn("20.5", args[0])
             self.assertIn("30.5", args[0])
     
+    def test_save_coordinates_many(self):
+        """Test saving several coordinates and reading them back."""
+        self.handler.save_coordinates_many([
+            Coordinates(x=1.5, y=2.5, z=3.5),
+            Coordinates(x=4.5, y=5.5, z=6.5),
+        ])
+        self.handler.close()
+        
+        coords_list = self.handler.get_all_coordinates()
+        self.assertEqual(len(coords_list), 2)
+        self.assertEqual(coords_list[0][0], Coordinates(x=1.5, y=2.5, z=3.5))
+        self.assertEqual(coords_list[1][0], Coordinates(x=4.5, y=5.5, z=6.5))
+    
+    def test_save_coordinates_after_file_replaced(self):
+        """Test that saving reopens the coordinates file after it is deleted or replaced."""
+        self.handler.save_coordinates(Coordinates(x=1.5, y=2.5, z=3.5))
+        
+        # Deleted files are recreated
+        os.unlink(self.temp_file.name)
+        self.handler.save_coordinates(Coordinates(x=4.5, y=5.5, z=6.5))
+        self.assertEqual(self.handler.get_latest_coordinates(), Coordinates(x=4.5, y=5.5, z=6.5))
+        
+        # Replaced files are written to in their new location
+        with open(self.temp_file.name + ".new", 'w') as f:
+            f.write("7.5, 8.5, 9.5, 2024-01-01 12:00:00\n")
+        os.replace(self.temp_file.name + ".new", self.temp_file.name)
+        self.handler.save_coordinates(Coordinates(x=10.5, y=11.5, z=12.5))
+        
+        coords_list = self.handler.get_all_coordinates()
+        self.assertEqual([coords for coords, _ in coords_list], [
+            Coordinates(x=7.5, y=8.5, z=9.5),
+            Coordinates(x=10.5, y=11.5, z=12.5),
+        ])
+    
     def test_get_latest_coordinates_empty_file(self):
         """Test getting latest coordinates from an empty file."""
         # Just create the file with no content
@@ -77,6 +113,37 @@ class TestScreenshotHandler(unittest.TestCase):
         self.assertEqual(coords.y, 5.5)
         self.assertEqual(coords.z, 6.6)
     
+    def test_get_latest_coordinates_large_file(self):
+        """Test getting latest coordinates when trailing comments exceed the tail window."""
+        with open(self.temp_file.name, 'w') as f:
+            f.write("# Comment line\n")
+            for i in range(500):
+                f.write(f"{i}.5, 2.2, 3.3, 2024-01-01 12:00:00\n")
+            for _ in range(500):
+                f.write("# Trailing comment line\n")
+        
+        coords = self.handler.get_latest_coordinates()
+        self.assertIsNotNone(coords)
+        self.assertEqual(coords.x, 499.5)
+        self.assertEqual(coords.y, 2.2)
+        self.assertEqual(coords.z, 3.3)
+    
+    def test_get_latest_coordinates_uses_index(self):
+        """Test getting latest coordinates through the index written on save."""
+        self.handler.save_coordinates(Coordinates(x=1.5, y=2.5, z=3.5))
+        self.handler.save_coordinates(Coordinates(x=4.5, y=5.5, z=6.5))
+        self.assertTrue(os.path.exists(self.temp_file.name + ".idx"))
+        
+        coords = self.handler.get_latest_coordinates()
+        self.assertEqual(coords, Coordinates(x=4.5, y=5.5, z=6.5))
+        
+        # A stale index is ignored after the file is changed elsewhere
+        with open(self.temp_file.name, 'a') as f:
+            f.write("7.5, 8.5, 9.5, 2024-01-01 12:00:00\n")
+        
+        coords = self.handler.get_latest_coordinates()
+        self.assertEqual(coords, Coordinates(x=7.5, y=8.5, z=9.5))
+    
     def test_get_all_coordinates(self):
         """Test getting all coordinates from file."""
         # Write test data to the file
@@ -101,6 +168,36 @@ class TestScreenshotHandler(unittest.TestCase):
         self.assertEqual(coords2.y, 5.5)
         self.assertEqual(coords2.z, 6.6)
         self.assertEqual(timestamp2, "2024-01-02 12:00:00")
+    
+    def test_get_all_coordinates_arrays(self):
+        """Test getting all coordinates as column arrays."""
+        # Write test data to the file, including an old x, z entry
+        with open(self.temp_file.name, 'w') as f:
+            f.write("# Comment line\n")
+            f.write("1.1, 2.2, 3.3, 2024-01-01 12:00:00\n")
+            f.write("4.4, 6.6\n")
+        
+        xs, ys, zs, timestamps = self.handler.get_all_coordinates_arrays()
+        self.assertEqual(list(xs), [1.1, 4.4])
+        self.assertEqual(list(ys), [2.2, 0.0])
+        self.assertEqual(list(zs), [3.3, 6.6])
+        self.assertEqual(timestamps, ["2024-01-01 12:00:00", "Imported data"])
+    
+    def test_get_all_coordinates_malformed_line(self):
+        """Test that both readers handle a malformed line the same way."""
+        with open(self.temp_file.name, 'w') as f:
+            f.write("1.1, 2.2, 3.3, 2024-01-01 12:00:00\n")
+            f.write("\n")
+            f.write("not a number, 5.5, 6.6, 2024-01-02 12:00:00\n")
+            f.write("7.7, 8.8, 9.9, 2024-01-03 12:00:00\n")
+        
+        coords_list = self.handler.get_all_coordinates()
+        xs, ys, zs, timestamps = self.handler.get_all_coordinates_arrays()
+        self.assertEqual(coords_list, [(Coordinates(x=1.1, y=2.2, z=3.3), "2024-01-01 12:00:00")])
+        self.assertEqual(
+            list(zip(xs, ys, zs, timestamps)),
+            [(c.x, c.y, c.z, timestamp) for c, timestamp in coords_list]
+        )
 
 
 if __name__ == '__main__':
@@ -0,0 +1,98 @@
+"""
+Unit tests for the Tarkov data manager module.
+"""
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tarkov_app.data_manager import tarkov_data
+from tarkov_app.data_manager.tarkov_data import TarkovDataManager
+
+ITEMS = {
+    "ammo1": {"name": "5.45x39mm PS gs", "shortName": "PS", "caliber": "Caliber545x39"},
+    "key1": {"name": "Ключ от общежития «Дикий»", "shortName": "Ключ", "tags": ["ключ", "🔑"]},
+    "rig1": {
+        "name": "Tactical rig",
+        "grid": {"width": 4, "height": 2, "slots": [{"id": "a"}, {"id": "b"}]},
+        "notes": "Braces } and ] inside a string, and a \"quoted\" word",
+    },
+    "ammo2": {"name": "9x19mm «Пст» gzh", "shortName": "Пст"},
+}
+
+
+class TestTarkovDataManager(unittest.TestCase):
+    """Test cases for the TarkovDataManager class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.temp_dir, "tarkovdata")
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        os.makedirs(self.data_dir)
+        
+        # Indented and not ASCII-escaped, so byte and character offsets differ
+        with open(os.path.join(self.data_dir, "items.en.json"), 'w', encoding='utf-8') as f:
+            json.dump(ITEMS, f, ensure_ascii=False, indent=2)
+        
+        self.manager = TarkovDataManager(self.data_dir, cache_dir=self.cache_dir)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_get_item_by_id(self):
+        """Test reading single items around non-ASCII values."""
+        for item_id, item in ITEMS.items():
+            self.assertEqual(self.manager.get_item_by_id(item_id), item)
+        
+        # Only the offset index was built; the items file was not loaded
+        self.assertNotIn("items", self.manager.cache)
+    
+    def test_get_item_by_id_nested_values(self):
+        """Test reading an item whose value contains nested objects and arrays."""
+        item = self.manager.get_item_by_id("rig1")
+        self.assertEqual(item["grid"]["slots"], [{"id": "a"}, {"id": "b"}])
+        self.assertEqual(item["notes"], ITEMS["rig1"]["notes"])
+    
+    def test_get_item_by_id_missing(self):
+        """Test that an unknown item ID returns None."""
+        self.assertIsNone(self.manager.get_item_by_id("missing"))
+    
+    def test_get_item_by_id_full_load_threshold(self):
+        """Test switching to loading the whole items file after many reads."""
+        with patch.object(tarkov_data, "ITEM_FULL_LOAD_THRESHOLD", 2):
+            self.assertEqual(self.manager.get_item_by_id("ammo1"), ITEMS["ammo1"])
+            self.assertEqual(self.manager.get_item_by_id("key1"), ITEMS["key1"])
+            self.assertNotIn("items", self.manager.cache)
+        
+            with patch.object(
+                self.manager, "get_data", wraps=self.manager.get_data
+            ) as get_data:
+                self.assertEqual(self.manager.get_item_by_id("ammo2"), ITEMS["ammo2"])
+                get_data.assert_called_once_with("items")
+        
+        self.assertIn("items", self.manager.cache)
+    
+    def test_item_offset_index_cache(self):
+        """Test that the item offset index is loaded back from the cache directory."""
+        self.assertEqual(self.manager.get_item_by_id("key1"), ITEMS["key1"])
+        cache_files = os.listdir(os.path.join(self.cache_dir, "data"))
+        self.assertEqual(len(cache_files), 1)
+        self.assertTrue(cache_files[0].endswith(".idx"))
+        
+        manager = TarkovDataManager(self.data_dir, cache_dir=self.cache_dir)
+        with patch.object(
+            TarkovDataManager, "_build_item_offset_index"
+        ) as build_index:
+            self.assertEqual(manager.get_item_by_id("ammo2"), ITEMS["ammo2"])
+            build_index.assert_not_called()
+        
+        # Nothing is written next to the data files
+        self.assertEqual(os.listdir(self.data_dir), ["items.en.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()